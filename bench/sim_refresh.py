@@ -0,0 +1,331 @@
+"""
+Runs a tree of the integration in simulated time and counts refreshes and GETs.
+
+The HA modules are the minimal stand-ins in bench/stubs, they follow HA's
+scheduling: the coordinator reschedules only while it has listeners, the
+request debouncer has a 10 s cooldown and fires immediately, polled entities
+are updated every 30 s. The CPE answers canned payloads after LATENCY.
+
+usage: python bench/sim_refresh.py [--tree DIR] [--press MINUTE] MINUTES
+
+--tree is a directory holding custom_components, by default this checkout.
+Extract an older revision to compare against, e.g.
+    mkdir -p /tmp/before && git archive <rev> custom_components | tar -x -C /tmp/before
+--press presses the Restart button at that simulated minute.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import selectors
+import sys
+import time
+from collections import Counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = "custom_components.askey_rtl6300_5g_cpe"
+LATENCY = 0.2  # simulated seconds per request
+POLL_INTERVAL = 30  # entity polling of HA's entity platform
+
+PAYLOADS = {
+    "lte/throughput": {"up": "123", "down": "4567"},
+    "lte/status_info": {
+        "sim_status": "2",
+        "signal_level": "4",
+        "tech_status": "5G_NSA",
+        "plmn_name": "ISP",
+        "roam_status": "0",
+        "network_name": "ISP",
+    },
+    "lte/signal_info": {
+        "lte_rssi": "-44",
+        "lte_rsrq": "-9",
+        "lte_rsrp": "-72",
+        "lte_sinr": "25.0",
+        "5g_rsrp": "-78",
+        "5g_rsrq": "-11",
+        "5g_sinr": "33.8",
+        "5g_pci": "123",
+        "5g_band": "3",
+        "5g_bandw": "20",
+        "lte_txpwr": "40",
+        "5g_txpwr": "N/A",
+        "5g_rxch": "372750",
+        "5g_txch": "353750",
+        "nr5g_rxfreq": "1863.75",
+        "nr5g_txfreq": "1768.75",
+    },
+    "CMGR/v4_status_info": {
+        "connectivity_type": "1",
+        "protocol": "0",
+        "connect_status": "0",
+        "ifname": "rmnet",
+        "ip": "10.0.2.0",
+        "netmask": "255.255.255.0",
+        "gateway": "10.0.2.1",
+        "primary_dns": "1.1.1.1",
+        "secondary_dns": "8.8.8.8",
+        "connect_time": "12.34",
+    },
+    "CMGR/v6_status_info": {
+        "connectivity_type": "1",
+        "protocol": "0",
+        "connect_status": "3",
+        "ifname": "rmnet",
+        "ip": "",
+        "plen": "0",
+        "pd_addr": "",
+        "pd_len": "0",
+        "gateway": "",
+        "primary_dns": "",
+        "secondary_dns": "",
+        "connect_time": "12.34",
+    },
+    "lte/cellular_info_ex": {
+        "data": [
+            {
+                "pci": "101",
+                "rssi": "-53.4",
+                "rsrp": "-83.6",
+                "rsrq": "-9.0",
+                "sinr": "13.6",
+                "band": "1",
+                "bandw": "20.000000",
+                "rxch": "300",
+                "txch": "18300",
+                "rxfreq": "2140.00",
+                "txfreq": "1950.00",
+            },
+            {
+                "pci": "102",
+                "rssi": "-55.4",
+                "rsrp": "-85.6",
+                "rsrq": "-10.0",
+                "sinr": "12.6",
+                "band": "3",
+                "bandw": "15.000000",
+                "rxch": "1300",
+                "txch": "19300",
+                "rxfreq": "1840.00",
+                "txfreq": "1750.00",
+            },
+        ]
+    },
+    "lte/cellular_info": {
+        "type": "LTE",
+        "gci": "1234567",
+        "mcc": "262",
+        "mnc": "1",
+        "tac": "12345",
+        "enb": "12345",
+        "serv_time": "123456",
+        "cqi": "12",
+        "count": "2",
+    },
+    "sms/inbox_list_count": {"totalcount": "1"},
+    "sms/outbox_list_count": {"totalcount": "42"},
+    "lte/cellular_stats": {
+        "tx_bytes": "329721290",
+        "rx_bytes": "1106203912",
+        "tx_dropped": "0",
+        "rx_dropped": "0",
+        "tx_error": "0",
+        "rx_error": "0",
+        "tx_packets": "2427066",
+        "rx_packets": "2977705",
+    },
+    "traffic/monthly": {
+        "rx": "55.34GB",
+        "tx": "18.56GB",
+        "total": "73.90GB",
+        "updated_datetime": "2025-10-09 20:09",
+    },
+}
+
+
+class Clock:
+    now = 0.0
+
+
+class VirtualSelector(selectors.DefaultSelector):
+    """Jumps the clock to the next timer instead of sleeping."""
+
+    def select(self, timeout=None):
+        if timeout is None:
+            raise RuntimeError("Event loop idle without timers")
+        if timeout > 0:
+            Clock.now += timeout
+        return super().select(0)
+
+
+class Services:
+    def async_register(self, *args, **kwargs):
+        pass
+
+    def async_remove(self, *args, **kwargs):
+        pass
+
+
+class Hass:
+    """The parts of HomeAssistant the integration touches during setup."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.data = {}
+        self.services = Services()
+        self.config_entries = self
+        self.stats = {"state_writes": 0, "coordinators": []}
+        self.entities = []
+
+    def async_create_background_task(self, coro, name=None):
+        return self.loop.create_task(coro)
+
+    async def async_forward_entry_setups(self, entry, platforms):
+        for platform in platforms:
+            module = importlib.import_module(f"{PACKAGE}.{platform}")
+            added = []
+
+            def add_entities(entities, update_before_add=False):
+                for entity in entities:
+                    description = getattr(entity, "entity_description", None)
+                    if not getattr(description, "entity_registry_enabled_default", True):
+                        continue  # disabled by default, never added by HA
+                    entity.hass = self
+                    added.append(entity)
+                    self.entities.append(entity)
+                    self.loop.create_task(self._add(entity))
+
+            await module.async_setup_entry(self, entry, add_entities)
+            if any(entity.should_poll for entity in added):
+                self._start_polling(added)
+
+    async def _add(self, entity):
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state()
+
+    def _start_polling(self, entities):
+        lock = asyncio.Lock()
+
+        async def update_entity_states():
+            if lock.locked():
+                return
+            async with lock:
+                await asyncio.gather(
+                    *(e.async_update_ha_state(True) for e in entities if e.should_poll)
+                )
+
+        def tick():
+            self.loop.create_task(update_entity_states())
+            self.loop.call_later(POLL_INTERVAL, tick)
+
+        self.loop.call_later(POLL_INTERVAL, tick)
+
+
+def patch_cpe(gets: Counter, puts: Counter):
+    """Canned answers in place of the HTTP client, counted per client."""
+    utils = importlib.import_module(f"{PACKAGE}.utils")
+
+    async def get(self, endpoint):
+        gets[id(self)] += 1
+        await asyncio.sleep(LATENCY)
+        return PAYLOADS.get(endpoint.strip("/"))
+
+    async def put(self, endpoint, *args, **kwargs):
+        puts[id(self)] += 1
+        await asyncio.sleep(LATENCY)
+        return {}
+
+    utils.AskeyUtils.get = get
+    utils.AskeyUtils.put = put
+    utils.AskeyUtils.async_close = lambda self: asyncio.sleep(0)
+
+
+def find_restart_button(entities):
+    for entity in entities:
+        unique_id = getattr(entity, "unique_id", None) or getattr(
+            entity, "_attr_unique_id", None
+        )
+        if unique_id == "askey_restart_button":
+            return entity
+    raise RuntimeError("No restart button in this tree")
+
+
+async def run(loop, minutes: float, press_at: float | None) -> dict:
+    from homeassistant.config_entries import ConfigEntry
+
+    gets, puts = Counter(), Counter()
+    patch_cpe(gets, puts)
+    hass = Hass(loop)
+    entry = ConfigEntry("entry", {"host": "192.0.2.1"})
+    await importlib.import_module(PACKAGE).async_setup_entry(hass, entry)
+    await asyncio.sleep(0)
+    setup_gets = sum(gets.values())
+    start = Clock.now
+    result = {}
+
+    if press_at is not None:
+        await asyncio.sleep(press_at * 60)
+        result["before_press"] = {
+            "gets": sum(gets.values()),
+            "refreshes": [c.refreshes for c in hass.stats["coordinators"]],
+        }
+        await find_restart_button(hass.entities).async_press()
+        await asyncio.sleep((minutes - press_at) * 60)
+    else:
+        await asyncio.sleep(minutes * 60)
+
+    coordinators = []
+    for coordinator in hass.stats["coordinators"]:
+        times = coordinator.refresh_times
+        interval = coordinator.update_interval
+        coordinators.append(
+            {
+                "listeners": len(coordinator._listeners),
+                "refreshes": coordinator.refreshes,
+                "refresh_requests": coordinator.refresh_requests,
+                "update_interval": interval.total_seconds() if interval else None,
+                "refresh_gaps": sorted(
+                    Counter(round(b - a, 1) for a, b in zip(times, times[1:])).items()
+                ),
+            }
+        )
+
+    return {
+        "minutes": round((Clock.now - start) / 60, 2),
+        "entities": len(hass.entities),
+        "polled_entities": sum(1 for e in hass.entities if e.should_poll),
+        "coordinators": coordinators,
+        "utils_clients": len(gets) or 1,
+        "gets_setup": setup_gets,
+        "gets_total": sum(gets.values()),
+        "gets_per_client": list(gets.values()),
+        "puts": sum(puts.values()),
+        "state_writes": hass.stats["state_writes"],
+        **result,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("minutes", type=float, help="simulated minutes to run")
+    parser.add_argument("--tree", default=os.path.dirname(BENCH_DIR))
+    parser.add_argument("--press", type=float, help="minute to press Restart at")
+    args = parser.parse_args()
+    if args.press is not None and not 0 <= args.press <= args.minutes:
+        parser.error("--press must fall inside the run")
+
+    sys.path[:0] = [os.path.join(BENCH_DIR, "stubs"), os.path.abspath(args.tree)]
+    loop = asyncio.SelectorEventLoop(VirtualSelector())
+    loop.time = lambda: Clock.now
+    # the integration's TTLs and scheduler read time.monotonic
+    time.monotonic = lambda: Clock.now
+    asyncio.set_event_loop(loop)
+
+    result = loop.run_until_complete(run(loop, args.minutes, args.press))
+    print(json.dumps({"tree": os.path.abspath(args.tree), **result}, indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+class ClientSession: pass
+class ClientError(Exception): pass
+class TCPConnector: pass
+class ClientTimeout:
+    def __init__(self, **kw): pass
@@ -0,0 +1,2 @@
+from homeassistant.helpers.entity import Entity
+class ButtonEntity(Entity): pass
@@ -0,0 +1,28 @@
+import enum
+from dataclasses import dataclass
+from homeassistant.helpers.entity import Entity
+
+class SensorDeviceClass(enum.StrEnum):
+    DATA_SIZE = "data_size"; DATA_RATE = "data_rate"; DURATION = "duration"
+    SIGNAL_STRENGTH = "signal_strength"; FREQUENCY = "frequency"; TIMESTAMP = "timestamp"
+    ENUM = "enum"
+
+class SensorStateClass(enum.StrEnum):
+    MEASUREMENT = "measurement"; TOTAL = "total"; TOTAL_INCREASING = "total_increasing"
+
+@dataclass(frozen=True, kw_only=True)
+class SensorEntityDescription:
+    key: str
+    name: str | None = None
+    icon: str | None = None
+    native_unit_of_measurement: str | None = None
+    entity_category: object = None
+    device_class: object = None
+    state_class: object = None
+    entity_registry_enabled_default: bool = True
+    suggested_display_precision: int | None = None
+    options: list | None = None
+    translation_key: str | None = None
+
+class SensorEntity(Entity):
+    entity_description = None
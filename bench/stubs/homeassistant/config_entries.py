@@ -0,0 +1,9 @@
+class ConfigEntry:
+    def __init__(self, entry_id, data):
+        self.entry_id = entry_id; self.data = data; self.options = {}
+        self._on_unload = []
+    def async_on_unload(self, fn): self._on_unload.append(fn)
+    def add_update_listener(self, fn): return lambda: None
+class ConfigFlow:
+    def __init_subclass__(cls, **kw): pass
+class OptionsFlow: pass
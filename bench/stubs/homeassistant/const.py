@@ -0,0 +1,12 @@
+class UnitOfInformation:
+    BYTES = "B"; KILOBYTES = "kB"; MEGABYTES = "MB"; GIGABYTES = "GB"
+    MEBIBYTES = "MiB"; GIBIBYTES = "GiB"
+class UnitOfTime:
+    MILLISECONDS = "ms"; SECONDS = "s"; MINUTES = "min"
+class UnitOfDataRate:
+    MEGABITS_PER_SECOND = "Mbit/s"
+SIGNAL_STRENGTH_DECIBELS_MILLIWATT = "dBm"
+SIGNAL_STRENGTH_DECIBELS = "dB"
+PERCENTAGE = "%"
+class UnitOfFrequency:
+    MEGAHERTZ = "MHz"
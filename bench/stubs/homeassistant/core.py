@@ -0,0 +1,7 @@
+import enum
+def callback(fn): return fn
+class HomeAssistant: pass
+class ServiceCall:
+    def __init__(self, data): self.data = data
+class SupportsResponse(enum.StrEnum):
+    NONE = "none"; OPTIONAL = "optional"; ONLY = "only"
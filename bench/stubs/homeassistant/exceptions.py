@@ -0,0 +1 @@
+class HomeAssistantError(Exception): pass
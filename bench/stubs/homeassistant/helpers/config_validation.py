@@ -0,0 +1,2 @@
+def ensure_list(v): return v if isinstance(v, list) else [v]
+boolean = bool
@@ -0,0 +1,16 @@
+import enum
+class EntityCategory(enum.StrEnum):
+    DIAGNOSTIC = "diagnostic"; CONFIG = "config"
+class Entity:
+    hass = None
+    _attr_should_poll = True
+    @property
+    def should_poll(self): return self._attr_should_poll
+    def async_on_remove(self, fn): self.__dict__.setdefault("_on_remove", []).append(fn)
+    async def async_added_to_hass(self): pass
+    def async_write_ha_state(self):
+        self.hass.stats["state_writes"] += 1
+    async def async_update_ha_state(self, force_refresh=False):
+        if force_refresh and hasattr(self, "async_update"):
+            await self.async_update()
+        self.async_write_ha_state()
@@ -0,0 +1 @@
+AddEntitiesCallback = object
@@ -0,0 +1,2 @@
+def async_track_time_interval(hass, action, interval, name=None):
+    return lambda: None
@@ -0,0 +1,6 @@
+class Store:
+    def __init__(self, hass, version, key): self.data = None
+    async def async_load(self): return self.data
+    def async_delay_save(self, fn, delay): self.data = fn()
+    async def async_save(self, data): self.data = data
+    async def async_remove(self): self.data = None; self.removed = True
@@ -0,0 +1,110 @@
+"""Refresh scheduling as in HA's DataUpdateCoordinator and Debouncer."""
+import asyncio
+from homeassistant.helpers.entity import Entity
+
+REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
+
+class UpdateFailed(Exception): pass
+
+class Debouncer:
+    """cooldown=10, immediate=True, like request_refresh_debouncer."""
+    def __init__(self, hass, function, cooldown=REQUEST_REFRESH_DEFAULT_COOLDOWN):
+        self.hass = hass; self.function = function; self.cooldown = cooldown
+        self._timer = None; self._execute_at_end = False; self._lock = asyncio.Lock()
+    async def async_call(self):
+        if self._timer is not None:
+            self._execute_at_end = True
+            return
+        async with self._lock:
+            if self._timer is not None:
+                self._execute_at_end = True
+                return
+            await self.function()
+            self._schedule_timer()
+    def _schedule_timer(self):
+        self._timer = self.hass.loop.call_later(
+            self.cooldown, lambda: self.hass.loop.create_task(self._on_timer())
+        )
+    async def _on_timer(self):
+        self._timer = None
+        if not self._execute_at_end:
+            return
+        self._execute_at_end = False
+        if self._lock.locked():
+            return
+        async with self._lock:
+            await self.function()
+            self._schedule_timer()
+    def async_cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._execute_at_end = False
+
+class DataUpdateCoordinator:
+    def __init__(self, hass, logger, name=None, update_interval=None, **kw):
+        self.hass = hass; self.logger = logger; self.name = name
+        self.update_interval = update_interval
+        self.data = None; self.last_update_success = True
+        self._listeners = {}; self._unsub_refresh = None
+        self._debounced_refresh = Debouncer(hass, self.async_refresh)
+        hass.stats["coordinators"].append(self)
+        self.refreshes = 0; self.refresh_requests = 0; self.refresh_times = []
+    def async_add_listener(self, update_callback, context=None):
+        schedule = not self._listeners
+        key = object()
+        self._listeners[key] = update_callback
+        if schedule:
+            self._schedule_refresh()
+        def remove():
+            self._listeners.pop(key, None)
+            if not self._listeners and self._unsub_refresh:
+                self._unsub_refresh.cancel(); self._unsub_refresh = None
+        return remove
+    def async_update_listeners(self):
+        for update_callback in list(self._listeners.values()):
+            update_callback()
+    def _schedule_refresh(self):
+        if self.update_interval is None:
+            return
+        if self._unsub_refresh:
+            self._unsub_refresh.cancel()
+        self._unsub_refresh = self.hass.loop.call_later(
+            self.update_interval.total_seconds(),
+            lambda: self.hass.loop.create_task(self._async_refresh(scheduled=True)),
+        )
+    async def async_config_entry_first_refresh(self):
+        await self._async_refresh()
+    async def async_request_refresh(self):
+        self.refresh_requests += 1
+        await self._debounced_refresh.async_call()
+    async def async_refresh(self):
+        await self._async_refresh()
+    async def _async_refresh(self, scheduled=False):
+        if self._unsub_refresh:
+            self._unsub_refresh.cancel(); self._unsub_refresh = None
+        self._debounced_refresh.async_cancel()
+        self.refreshes += 1
+        self.refresh_times.append(self.hass.loop.time())
+        try:
+            self.data = await self._async_update_data()
+            self.last_update_success = True
+        except UpdateFailed:
+            self.last_update_success = False
+        if self._listeners:
+            self._schedule_refresh()
+        self.async_update_listeners()
+
+class CoordinatorEntity(Entity):
+    _attr_should_poll = False
+    def __init__(self, coordinator, context=None):
+        self.coordinator = coordinator
+    def __class_getitem__(cls, item): return cls
+    async def async_added_to_hass(self):
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+    def _handle_coordinator_update(self):
+        self.async_write_ha_state()
+    async def async_update(self):
+        await self.coordinator.async_request_refresh()
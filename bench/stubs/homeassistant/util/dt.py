@@ -0,0 +1,2 @@
+from datetime import datetime, timezone
+def utcnow(): return datetime.now(timezone.utc)
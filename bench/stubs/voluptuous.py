@@ -0,0 +1,2 @@
+def _any(*a, **k): return (lambda *x, **y: None)
+Schema = All = Coerce = Range = Optional = Required = In = _any
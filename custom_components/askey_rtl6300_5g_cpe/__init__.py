@@ -1,16 +1,44 @@
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
 
 import logging
 
 from .utils import AskeyUtils
 
-from .const import DOMAIN
+from .const import (
+    ALIGN_DEFAULT_DURATION,
+    ALIGN_MAX_DURATION,
+    CONF_HIGH_RATE_SAMPLING,
+    CONF_SAMPLE_WINDOW,
+    DEFAULT_SAMPLE_WINDOW,
+    DOMAIN,
+    PLATFORMS,
+    POLLING_TIERS,
+    PROFILE_DEFAULT_CYCLES,
+    PROFILE_MAX_CYCLES,
+    PROFILE_TOP,
+)
 from .coordinator import AskeyDataUpdateCoordinator
-
+from .counters import CellularStatsTotals
+from .sampler import AskeySignalSampler
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICES = (
+    "send_sms",
+    "get_inbox",
+    "clear_inbox",
+    "clear_outbox",
+    "align_antenna",
+    "debug_endpoints",
+    "profile_refresh",
+)
+# coordinator keys accepted by debug_endpoints
+ENDPOINTS = [key for _, keys in POLLING_TIERS.values() for key in keys]
+
 # import debugpy
 
 # _LOGGER.warning("Starting debugpy listener on port 5678...")
@@ -27,49 +55,148 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_stop_profile()
+        await coordinator.cellular_totals.async_save()
+        await coordinator.utils.async_close()
+        if not hass.data[DOMAIN]:
+            for service in SERVICES:
+                hass.services.async_remove(DOMAIN, service)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Delete the lifetime traffic totals of a removed entry from .storage."""
+    await CellularStatsTotals(hass, entry.entry_id).async_remove()
+
+
+def _loaded_coordinator(hass: HomeAssistant) -> AskeyDataUpdateCoordinator:
+    """Coordinator of a loaded entry, looked up when a service is called."""
+    coordinators = hass.data.get(DOMAIN)
+    if not coordinators:
+        raise HomeAssistantError("No ASKEY router is loaded")
+    return next(iter(coordinators.values()))
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up the integration via UI config entry."""
     hass.data.setdefault(DOMAIN, {})
     utils = AskeyUtils(hass, entry)
     coordinator = AskeyDataUpdateCoordinator(hass, entry, utils)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.cellular_totals.async_load()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await utils.async_close()
+        raise
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up platforms (e.g. sensor)
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    if entry.options.get(CONF_HIGH_RATE_SAMPLING, False):
+        coordinator.sampler = AskeySignalSampler(
+            hass, utils, entry.options.get(CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW)
+        )
+        entry.async_on_unload(coordinator.sampler.async_start())
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # Set up platforms, they all share the coordinator and its AskeyUtils client
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # services resolve the live coordinator per call, a handler bound at setup
+    # would outlive its entry and call a closed client
+    async def _async_send_sms(call: ServiceCall):
+        return await _loaded_coordinator(hass).utils.handle_send_sms(call)
+
+    async def _async_get_inbox(call: ServiceCall):
+        return await _loaded_coordinator(hass).utils.handle_get_inbox(call)
+
+    async def _async_clear_inbox(call: ServiceCall):
+        return await _loaded_coordinator(hass).utils.handle_clear_inbox(call)
+
+    async def _async_clear_outbox(call: ServiceCall):
+        return await _loaded_coordinator(hass).utils.handle_clear_outbox(call)
+
+    async def _async_align_antenna(call: ServiceCall) -> dict:
+        return await _loaded_coordinator(hass).aligner.handle_align_antenna(call)
+
+    async def _async_debug_endpoints(call: ServiceCall):
+        await _loaded_coordinator(hass).handle_debug_endpoints(call)
+
+    async def _async_profile_refresh(call: ServiceCall) -> dict:
+        return await _loaded_coordinator(hass).handle_profile_refresh(call)
 
     # Register the services using lambda functions
     hass.services.async_register(
         domain=DOMAIN,
         service="send_sms",
-        service_func=utils.handle_send_sms,
+        service_func=_async_send_sms,
     )
 
     hass.services.async_register(
         domain=DOMAIN,
         service="get_inbox",
-        service_func=utils.handle_get_inbox,
+        service_func=_async_get_inbox,
     )
 
     hass.services.async_register(
         domain=DOMAIN,
         service="clear_inbox",
-        service_func=utils.handle_clear_inbox,
+        service_func=_async_clear_inbox,
     )
 
     hass.services.async_register(
         domain=DOMAIN,
         service="clear_outbox",
-        service_func=utils.handle_clear_outbox,
+        service_func=_async_clear_outbox,
     )
 
-    # Forward the setup to the button platform
-    await hass.config_entries.async_forward_entry_setups(entry, ["button"])
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="align_antenna",
+        service_func=_async_align_antenna,
+        schema=vol.Schema(
+            {
+                vol.Optional("duration", default=ALIGN_DEFAULT_DURATION): vol.All(
+                    vol.Coerce(int), vol.Range(min=5, max=ALIGN_MAX_DURATION)
+                )
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="debug_endpoints",
+        service_func=_async_debug_endpoints,
+        schema=vol.Schema(
+            {
+                vol.Optional("endpoints"): vol.All(cv.ensure_list, [vol.In(ENDPOINTS)]),
+                vol.Optional("enabled", default=True): cv.boolean,
+            }
+        ),
+    )
+
+    hass.services.async_register(
+        domain=DOMAIN,
+        service="profile_refresh",
+        service_func=_async_profile_refresh,
+        schema=vol.Schema(
+            {
+                vol.Optional("cycles", default=PROFILE_DEFAULT_CYCLES): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_CYCLES)
+                ),
+                vol.Optional("top", default=PROFILE_TOP): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=100)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
 
     return True
@@ -5,8 +5,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import AskeyDataUpdateCoordinator
-from .utils import AskeyUtils
-from .coordinator import AskeyDataUpdateCoordinator
 
 
 async def async_setup_entry(
@@ -15,8 +13,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     """Set up the ASKEY button platform."""
-    utils = AskeyUtils(hass, entry)
-    coordinator = AskeyDataUpdateCoordinator(hass, entry, utils)
+    coordinator: AskeyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
         [
@@ -60,4 +57,4 @@ class AskeyBaseButton(ButtonEntity):
 
     async def async_press(self):
         await self._press_action()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_full_refresh()
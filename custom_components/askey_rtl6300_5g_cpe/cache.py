@@ -0,0 +1,105 @@
+import logging
+import time
+
+from .utils import log_throttled
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    __slots__ = ("payload", "value", "updated", "attempted", "failures")
+
+    def __init__(self):
+        self.payload = None  # raw Result of the last good response
+        self.value = None  # payload parsed into its typed record
+        self.updated = None  # monotonic time of the last good payload
+        self.attempted = None  # monotonic time of the last fetch attempt
+        self.failures = 0  # consecutive failed fetches
+
+
+class EndpointCache:
+    """
+    Last good payload per coordinator key, parsed once when it arrives.
+    A failed fetch keeps the previous payload until it is older than the key's TTL,
+    so one failing endpoint only takes its own sensors down, and only once stale.
+    """
+
+    def __init__(self, ttls: dict, parsers: dict):
+        self.ttls = ttls
+        self.parsers = parsers
+        self._entries = {}
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def update(self, key: str, payload, now: float = None) -> bool:
+        """
+        Record the outcome of a fetch, None meaning it failed.
+        A payload the parser rejects counts as a failure too.
+        """
+        now = time.monotonic() if now is None else now
+        entry = self._entries.setdefault(key, CacheEntry())
+        entry.attempted = now
+        if payload is not None:
+            try:
+                value = self.parsers[key](payload)
+            except (KeyError, IndexError, TypeError, AttributeError, ValueError) as err:
+                log_throttled(
+                    _LOGGER,
+                    logging.WARNING,
+                    f"payload {key}",
+                    "Unexpected %s payload %s: %s",
+                    key,
+                    payload,
+                    err,
+                )
+                value = None
+            if value is not None:
+                entry.payload = payload
+                entry.value = value
+                entry.updated = now
+                entry.failures = 0
+                return True
+        entry.failures += 1
+        return False
+
+    def age(self, key: str, now: float = None):
+        """Seconds since the last good payload, None if there never was one."""
+        entry = self._entries.get(key)
+        if entry is None or entry.updated is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return now - entry.updated
+
+    def is_fresh(self, key: str, now: float = None) -> bool:
+        age = self.age(key, now)
+        return age is not None and age <= self.ttls.get(key, float("inf"))
+
+    def get(self, key: str, now: float = None):
+        """The last good typed record, None once it is stale."""
+        if not self.is_fresh(key, now):
+            return None
+        return self._entries[key].value
+
+    def raw(self, key: str):
+        """The last good raw payload, regardless of its age."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry.payload
+
+    def snapshot(self, now: float = None) -> dict:
+        """Fresh typed records (None when stale) for every key fetched so far."""
+        now = time.monotonic() if now is None else now
+        return {key: self.get(key, now) for key in self._entries}
+
+    def as_dict(self, now: float = None) -> dict:
+        """Age, staleness and failure count per key, for diagnostics."""
+        now = time.monotonic() if now is None else now
+        result = {}
+        for key, entry in self._entries.items():
+            age = self.age(key, now)
+            result[key] = {
+                "age": None if age is None else round(age, 1),
+                "stale": not self.is_fresh(key, now),
+                "failures": entry.failures,
+            }
+        return result
@@ -1,6 +1,14 @@
 import voluptuous as vol
 from homeassistant import config_entries
-from .const import DOMAIN, CONF_HOST, DEFAULT_HOST
+from homeassistant.core import callback
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    DEFAULT_HOST,
+    CONF_HIGH_RATE_SAMPLING,
+    CONF_SAMPLE_WINDOW,
+    DEFAULT_SAMPLE_WINDOW,
+)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -22,3 +30,33 @@ class AskeyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return AskeyOptionsFlow()
+
+
+class AskeyOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of ASKEY RTL6300 5G CPE."""
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_HIGH_RATE_SAMPLING,
+                        default=options.get(CONF_HIGH_RATE_SAMPLING, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SAMPLE_WINDOW,
+                        default=options.get(CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                }
+            ),
+        )
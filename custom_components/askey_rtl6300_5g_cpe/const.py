@@ -2,6 +2,131 @@ DOMAIN = "askey_rtl6300_5g_cpe"
 DEFAULT_NAME = "ASKEY RTL6300 5G CPE"
 CONF_HOST = "host"
 
+PLATFORMS = ["sensor", "button"]
+
 DEFAULT_HOST = "172.20.168.1"  # Default host IP address
 
 SCAN_INTERVAL = 60  # seconds
+
+MAX_CONCURRENT_REQUESTS = 4  # parallel requests against the CPE web server
+ENDPOINT_TIMEOUT = 10  # seconds, deadline for a single endpoint call
+
+# Endpoint groups polled at their own interval, in seconds. The coordinator
+# ticks at the shortest interval and only fetches the groups that are due.
+POLLING_TIERS = {
+    "radio": (
+        5,
+        ("signal_info", "cellular_info_ex", "cellular_info_ca", "throughput"),
+    ),
+    "connectivity": (
+        SCAN_INTERVAL,
+        ("status_info", "status_info_v4", "cellular_info", "cellular_stats"),
+    ),
+    "slow": (
+        15 * 60,
+        ("status_info_v6", "sms_inbox_count", "sms_outbox_count", "traffic_monthly"),
+    ),
+}
+
+# Adaptive polling: back off while the CPE does not answer, poll faster for a
+# while when the connection drops or the SINR falls sharply.
+MAX_BACKOFF_INTERVAL = 300  # seconds
+BURST_INTERVAL = 2  # seconds
+BURST_DURATION = 60  # seconds
+BURST_TIERS = ("radio", "connectivity")
+SINR_DROP_THRESHOLD = 6.0  # dB between two consecutive samples
+
+# Endpoints read by the coordinator itself, polled even without enabled entities
+CONTROLLER_KEYS = ("status_info_v4", "signal_info")
+
+# Keys computed by the coordinator from other endpoints (see models.DERIVERS,
+# cellular_rates / cellular_totals come from counters.py, smoothed_signal from
+# smoothing.py).
+# Entities reading them consume every source, they stay available while any
+# source is fresh.
+DERIVED_KEYS = {
+    "carrier_aggregation": ("cellular_info_ca", "cellular_info_ex"),
+    "cellular_rates": ("cellular_stats",),
+    "cellular_totals": ("cellular_stats",),
+    "smoothed_signal": ("signal_info", "cellular_info_ex"),
+}
+
+# A cached payload is kept through failed fetches and marked stale once it is
+# older than this many intervals of its polling tier
+STALE_AFTER_INTERVALS = 3
+
+# Refresh cycles whose timing is kept for the diagnostics download
+REFRESH_HISTORY = 20
+# Payload fields holding addresses of the subscriber, blanked in diagnostics
+REDACT_KEYS = {
+    "ip",
+    "gateway",
+    "primary_dns",
+    "secondary_dns",
+    "pd_addr",
+    "gci",
+    "phone_nums",
+    "phone_number",
+}
+
+# HTTP connection pool dedicated to the CPE's small web server
+CPE_CONNECTION_LIMIT = MAX_CONCURRENT_REQUESTS  # open connections to the CPE
+KEEPALIVE_TIMEOUT = 30  # seconds an idle connection is kept open
+CONNECT_TIMEOUT = 5  # seconds
+
+MISS_REPORT_INTERVAL = 300  # seconds between debug reports of the same missing field
+
+# Opt-in high-rate signal sampling (options flow)
+CONF_HIGH_RATE_SAMPLING = "high_rate_sampling"
+CONF_SAMPLE_WINDOW = "sample_window"
+DEFAULT_SAMPLE_WINDOW = 60  # seconds of samples aggregated into one state
+SAMPLE_INTERVAL = 1  # seconds between two /lte/signal_info samples
+# SignalInfo fields sampled, the firmware reports no NR RSSI
+SAMPLED_METRICS = (
+    "lte_rsrp",
+    "lte_rsrq",
+    "lte_sinr",
+    "lte_rssi",
+    "nr_rsrp",
+    "nr_rsrq",
+    "nr_sinr",
+)
+
+# align_antenna service: samples back to back, spaced to the CPE's round-trip
+ALIGN_DEFAULT_DURATION = 30  # seconds
+ALIGN_MAX_DURATION = 300  # seconds
+ALIGN_MAX_RATE = 10  # samples per second, one sample is two requests
+ALIGN_RTT_SMOOTHING = 0.3  # weight of the newest round-trip in the estimate
+
+# profile_refresh service: cProfile capture of the next refresh cycles
+PROFILE_DEFAULT_CYCLES = 3
+PROFILE_MAX_CYCLES = 20
+PROFILE_TOP = 20  # hotspots returned in the service response
+PROFILE_TIMEOUT = 600  # seconds to wait for the cycles before reporting
+
+# Lifetime traffic totals persisted in .storage
+COUNTER_STORAGE_VERSION = 1
+COUNTER_SAVE_DELAY = 60  # seconds, writes of the totals are debounced
+# A counter drop is a 32-bit wrap only when the wrapped increase stays within
+# this multiple of the rate of the previous interval, otherwise it is a reset
+COUNTER_WRAP_RATE_FACTOR = 4
+
+# Deadbands of the radio sensors: a state is written only when the value moves
+# at least this much, or DEFAULT_MAX_SILENCE seconds after the last write
+SIGNAL_DEADBANDS = {"rsrp": 1.0, "rssi": 1.0, "rsrq": 0.5, "sinr": 1.0}  # dB(m)
+DEFAULT_MAX_SILENCE = 300  # seconds
+
+# Smoothing of the radio metrics published as "Smoothed" sensors:
+# metric -> ("ema", weight of the newest sample) or ("median", window in samples).
+# Metrics left out are not smoothed.
+SMOOTHING = {
+    "nr_rsrp": ("ema", 0.3),
+    "nr_rsrq": ("ema", 0.3),
+    "nr_sinr": ("median", 5),
+    "pcc_rsrp": ("ema", 0.3),
+    "pcc_rsrq": ("ema", 0.3),
+    "pcc_sinr": ("median", 5),
+    "scc1_rsrp": ("ema", 0.3),
+    "scc1_rsrq": ("ema", 0.3),
+    "scc1_sinr": ("median", 5),
+}
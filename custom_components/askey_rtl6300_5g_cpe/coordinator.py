@@ -1,14 +1,43 @@
+import asyncio
 import logging
+import time
+from collections import Counter, deque
 from datetime import timedelta
-import aiohttp
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 from homeassistant.config_entries import ConfigEntry
 
-from .utils import AskeyUtils
-from .const import DOMAIN, SCAN_INTERVAL
+from .utils import AskeyUtils, log_throttled
+from .cache import EndpointCache
+from .counters import CellularStatsRates, CellularStatsTotals
+from .models import DERIVERS, PARSERS
+from .profiler import RefreshProfiler, write_report
+from .sampler import AntennaAligner
+from .smoothing import SignalSmoother
+from .scheduler import AdaptiveIntervalController, TierScheduler
+from .const import (
+    BURST_DURATION,
+    BURST_INTERVAL,
+    BURST_TIERS,
+    CONTROLLER_KEYS,
+    DERIVED_KEYS,
+    DOMAIN,
+    ENDPOINT_TIMEOUT,
+    MAX_BACKOFF_INTERVAL,
+    MAX_CONCURRENT_REQUESTS,
+    POLLING_TIERS,
+    PROFILE_TOP,
+    REFRESH_HISTORY,
+    SMOOTHING,
+    SINR_DROP_THRESHOLD,
+    STALE_AFTER_INTERVALS,
+)
 
 _LOGGER = logging.getLogger(__name__)
+# parent of one logger per endpoint, e.g. <package>.endpoints.signal_info
+ENDPOINT_LOGGER = f"{__package__}.endpoints"
 
 
 class AskeyDataUpdateCoordinator(DataUpdateCoordinator):
@@ -21,35 +50,275 @@ class AskeyDataUpdateCoordinator(DataUpdateCoordinator):
         self.host = config_entry.data.get("host")
         self.utils = utils
         self.base_url = f"http://{self.host}"
-        self.session = aiohttp.ClientSession()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._fetchers = {
+            "throughput": self.get_throughput,
+            "status_info": self.get_status_info,
+            "signal_info": self.get_signal_info,
+            "status_info_v4": self.get_status_info_v4,
+            "status_info_v6": self.get_status_info_v6,
+            "cellular_info_ex": self.get_cellular_info_ex,
+            "cellular_info_ca": self.get_cellular_info_ca,
+            "cellular_info": self.get_cellular_info,
+            "sms_inbox_count": self.get_inbox_count,
+            "sms_outbox_count": self.get_outbox_count,
+            "cellular_stats": self.get_cellular_stats,
+            "traffic_monthly": self.get_traffic_monthly,
+        }
+        # raw payloads of an endpoint are logged when its logger is at debug level
+        self.endpoint_loggers = {
+            key: logging.getLogger(f"{ENDPOINT_LOGGER}.{key}") for key in self._fetchers
+        }
+        # wall / serial / saved seconds of the last refresh cycle
+        self.last_refresh_timing = None
+        # timings of the last refresh cycles with the seconds of each endpoint
+        self.refresh_history = deque(maxlen=REFRESH_HISTORY)
+        # coordinator key -> number of enabled entities reading it
+        self._consumers = Counter()
+        self.scheduler = TierScheduler(POLLING_TIERS)
+        self.cache = EndpointCache(
+            {
+                key: interval * STALE_AFTER_INTERVALS
+                for interval, keys in POLLING_TIERS.values()
+                for key in keys
+            },
+            PARSERS,
+        )
+        self._full_refresh = False
+        self.cellular_rates = CellularStatsRates()
+        self.cellular_totals = CellularStatsTotals(hass, config_entry.entry_id)
+        self.smoother = SignalSmoother(SMOOTHING)
+        # sensor key -> WriteCounter of its state writes
+        self.state_writes = {}
+        # RefreshProfiler while a profile_refresh capture runs
+        self._profiler = None
+        self.aligner = AntennaAligner(utils)
+        # AskeySignalSampler when high-rate sampling is enabled in the options
+        self.sampler = None
+        self.adaptive = AdaptiveIntervalController(
+            base_interval=self.scheduler.tick,
+            max_backoff=MAX_BACKOFF_INTERVAL,
+            burst_interval=BURST_INTERVAL,
+            burst_duration=BURST_DURATION,
+            sinr_drop=SINR_DROP_THRESHOLD,
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=SCAN_INTERVAL),
+            update_interval=timedelta(seconds=self.scheduler.tick),
         )
 
     async def _async_update_data(self):
-        """Fetch data from the API and update state."""
-        try:
-            result = {
-                "throughput": await self.get_throughput(),
-                "status_info": await self.get_status_info(),
-                "signal_info": await self.get_signal_info(),
-                "status_info_v4": await self.get_status_info_v4(),
-                "status_info_v6": await self.get_status_info_v6(),
-                "cellular_info_ex": await self.get_cellular_info_ex(),
-                "cellular_info": await self.get_cellular_info(),
-                "sms_inbox_count": await self.get_inbox_count(),
-                "sms_outbox_count": await self.get_outbox_count(),
-                "cellular_stats": await self.get_cellular_stats(),
-                "traffic_monthly": await self.get_traffic_monthly(),
+        """
+        Fetch the endpoint groups that are due and merge them into the snapshot.
+        Failed endpoints keep their last good payload until it goes stale.
+        """
+        now = time.monotonic()
+        tiers = self.scheduler.due(
+            now,
+            force=self._full_refresh,
+            always=BURST_TIERS if self.adaptive.bursting else (),
+        )
+        self._full_refresh = False
+        fetched = await self._async_fetch_all(
+            self._consumed_keys(self.scheduler.keys(tiers))
+        )
+        self.scheduler.mark_run(tiers, now)
+
+        updated = [
+            key
+            for key, payload in fetched.items()
+            if self.cache.update(key, payload, now)
+        ]
+        result = self.cache.snapshot(now)
+        for key, derive in DERIVERS.items():
+            result[key] = derive(*(result.get(source) for source in DERIVED_KEYS[key]))
+        self._update_stateful(now, updated, result)
+        self._adapt_interval(now, fetched, updated, result)
+        self._log_refresh(fetched, updated)
+
+        if not any(payload is not None for payload in result.values()):
+            raise UpdateFailed("No endpoint of the Askey API returned data")
+        return result
+
+    def _log_refresh(self, fetched: dict, updated: list):
+        """Debug output of a refresh, nothing is formatted unless it is emitted."""
+        for key, payload in fetched.items():
+            logger = self.endpoint_loggers[key]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s payload: %s", key, payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Refreshed %d endpoints, updated %s, failed %s",
+                len(fetched),
+                updated,
+                [key for key, payload in fetched.items() if payload is None],
+            )
+
+    def _update_stateful(self, now: float, updated: list, data: dict):
+        """
+        Feed the derived values that keep state between polls, only with freshly
+        fetched records so a cached one is never counted twice.
+        """
+        if "cellular_stats" in updated:
+            self.cellular_rates.update(data["cellular_stats"], now)
+            self.cellular_totals.update(data["cellular_stats"], now)
+        if "signal_info" in updated:
+            self.smoother.feed_signal(data["signal_info"])
+        if "cellular_info_ex" in updated:
+            self.smoother.feed_carriers(data["cellular_info_ex"])
+
+        stats_fresh = data.get("cellular_stats") is not None
+        data["cellular_rates"] = self.cellular_rates.value if stats_fresh else None
+        data["cellular_totals"] = self.cellular_totals.value if stats_fresh else None
+        data["smoothed_signal"] = (
+            self.smoother.value if self.is_fresh(("smoothed_signal",)) else None
+        )
+
+    def is_fresh(self, keys) -> bool:
+        """
+        True when every given coordinator key has a non-stale payload.
+        A derived key is fresh while any of its sources is.
+        """
+        return all(
+            (
+                any(self.cache.is_fresh(source) for source in DERIVED_KEYS[key])
+                if key in DERIVED_KEYS
+                else self.cache.is_fresh(key)
+            )
+            for key in keys
+        )
+
+    @callback
+    def async_add_consumer(self, keys):
+        """
+        Register an enabled entity reading the given coordinator keys.
+        Returns a callback that unregisters it again.
+        """
+        keys = tuple(source for key in keys for source in DERIVED_KEYS.get(key, (key,)))
+        self._consumers.update(keys)
+
+        @callback
+        def remove_consumer():
+            self._consumers.subtract(keys)
+            dropped = [key for key in keys if self._consumers[key] <= 0]
+            for key in dropped:
+                del self._consumers[key]
+            if dropped:
+                _LOGGER.debug("Endpoints %s have no consumer left", dropped)
+
+        return remove_consumer
+
+    @property
+    def consumers(self) -> dict:
+        """Enabled entities per coordinator key, for diagnostics."""
+        return dict(self._consumers)
+
+    def _consumed_keys(self, due_keys):
+        """
+        Keep the due endpoints that an enabled entity or the adaptive controller reads,
+        plus consumed endpoints that were never fetched (entity just enabled).
+        Until entities are registered everything is fetched.
+        """
+        if not self._consumers:
+            return due_keys
+
+        def wanted(key):
+            return key in self._consumers or key in CONTROLLER_KEYS
+
+        keys = [key for key in due_keys if wanted(key)]
+        keys += [
+            key
+            for key in self._fetchers
+            if wanted(key) and key not in self.cache and key not in keys
+        ]
+        return keys
+
+    def _adapt_interval(self, now: float, fetched: dict, updated: list, data: dict):
+        """Let the adaptive controller pick the delay until the next tick."""
+        reachable = not fetched or any(value is not None for value in fetched.values())
+        status_info_v4 = data.get("status_info_v4")
+        signal_info = data.get("signal_info")
+        interval = self.adaptive.update(
+            now,
+            reachable,
+            connect_status=(
+                status_info_v4.connect_status if "status_info_v4" in updated else None
+            ),
+            sinr=(
+                {"lte_sinr": signal_info.lte_sinr, "5g_sinr": signal_info.nr_sinr}
+                if "signal_info" in updated
+                else None
+            ),
+        )
+        if interval != self.update_interval.total_seconds():
+            _LOGGER.debug(
+                "Polling interval changed to %ss (%s)", interval, self.adaptive.mode
+            )
+            self.update_interval = timedelta(seconds=interval)
+
+    async def _async_fetch(self, key: str):
+        """Fetch one endpoint under the concurrency cap and its deadline."""
+        async with self._semaphore:
+            start = time.monotonic()
+            try:
+                async with asyncio.timeout(ENDPOINT_TIMEOUT):
+                    value = await self._fetchers[key]()
+            except TimeoutError:
+                log_throttled(
+                    _LOGGER,
+                    logging.WARNING,
+                    f"timeout {key}",
+                    "Timed out fetching %s after %s seconds",
+                    key,
+                    ENDPOINT_TIMEOUT,
+                )
+                value = None
+            except Exception as err:
+                log_throttled(
+                    _LOGGER,
+                    logging.ERROR,
+                    f"fetch {key}",
+                    "Error fetching %s from Askey API: %s",
+                    key,
+                    err,
+                )
+                value = None
+            return key, value, time.monotonic() - start
+
+    async def _async_fetch_all(self, keys):
+        """
+        Fetch the given endpoints concurrently.
+        A cycle now takes as long as the slowest call instead of the sum of all calls.
+        """
+        start = time.monotonic()
+        results = await asyncio.gather(*(self._async_fetch(key) for key in keys))
+        wall = time.monotonic() - start
+        serial = sum(duration for _, _, duration in results)
+
+        self.last_refresh_timing = {
+            "wall": round(wall, 3),
+            "serial": round(serial, 3),
+            "saved": round(max(serial - wall, 0.0), 3),
+        }
+        self.refresh_history.append(
+            {
+                "at": dt_util.utcnow().isoformat(),
+                **self.last_refresh_timing,
+                "endpoints": {
+                    key: round(duration, 3) for key, _, duration in results
+                },
             }
-            _LOGGER.info(f"Fetched data: {result}")
-            return result
-        except Exception as err:
-            _LOGGER.error(f"Error fetching data from Askey API: {err}")
-            raise UpdateFailed(f"Failed to fetch data: {err}")
+        )
+        _LOGGER.debug(
+            "Fetched %d endpoints in %.3fs (%.3fs sequentially, saved %.3fs)",
+            len(results),
+            wall,
+            serial,
+            self.last_refresh_timing["saved"],
+        )
+        return {key: value for key, value, _ in results}
 
     # {"Status":"ok","ModuleCommand":"/lte/throughput","Result":{"up":"xxx","down":"yyy"}}
     async def get_throughput(self):
@@ -71,6 +340,10 @@ class AskeyDataUpdateCoordinator(DataUpdateCoordinator):
     async def get_cellular_info_ex(self):
         return await self.utils.get("/lte/cellular_info_ex")
 
+    # carrier aggregation summary, parsed defensively, see models.parse_cellular_info_ca
+    async def get_cellular_info_ca(self):
+        return await self.utils.get("/lte/cellular_info_ca")
+
     # {"Status":"ok","ModuleCommand":"/lte/cellular_info","Result":{"type":"LTE","gci":"XXXXXXX","mcc":"XXX","mnc":"X","tac":"XXXXX","enb":"XXXXX","serv_time":"XXXXXX","cqi":"XX","count":"X"}}
     async def get_cellular_info(self):
         return await self.utils.get("/lte/cellular_info")
@@ -107,6 +380,55 @@ class AskeyDataUpdateCoordinator(DataUpdateCoordinator):
             "/lte/control", {"command": "2", "ifname": "rmnet_data0"}
         )
 
+    async def handle_debug_endpoints(self, call: ServiceCall):
+        """
+        Handle the debug_endpoints service call.
+        Turns payload logging of the given endpoints (all when none given) on or
+        off without raising the log level of the whole integration.
+        """
+        keys = call.data.get("endpoints") or list(self.endpoint_loggers)
+        level = logging.DEBUG if call.data["enabled"] else logging.NOTSET
+        for key in keys:
+            self.endpoint_loggers[key].setLevel(level)
+        _LOGGER.info(
+            "Payload logging %s for %s", "enabled" if level else "reset", keys
+        )
+
+    async def handle_profile_refresh(self, call: ServiceCall) -> dict:
+        """
+        Handle the profile_refresh service call.
+        Profiles the next refresh cycles, writes a pstats file to the config
+        directory and returns the hotspots.
+        """
+        if self._profiler is not None:
+            raise HomeAssistantError("A refresh profile is already running")
+        self._profiler = RefreshProfiler(self, call.data["cycles"])
+        try:
+            profile = await self._profiler.async_capture()
+            cycles = self._profiler.completed
+        finally:
+            self._profiler = None
+
+        path = self.hass.config.path(
+            f"{DOMAIN}_refresh_{dt_util.utcnow():%Y%m%d_%H%M%S}.pstats"
+        )
+        report = await self.hass.async_add_executor_job(
+            write_report, profile, path, call.data.get("top", PROFILE_TOP)
+        )
+        _LOGGER.info("Profiled %d refresh cycles into %s", cycles, path)
+        return {"cycles": cycles, **report}
+
+    @callback
+    def async_stop_profile(self):
+        """End a running profile_refresh capture early, e.g. when the entry unloads."""
+        if self._profiler is not None:
+            self._profiler.finish()
+
+    async def async_request_full_refresh(self):
+        """Refresh every endpoint group on the next run, regardless of its tier."""
+        self._full_refresh = True
+        await self.async_request_refresh()
+
     async def async_request_data(self):
         """Manually trigger data update."""
         return await self.async_refresh()
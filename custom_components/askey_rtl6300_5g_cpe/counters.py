@@ -0,0 +1,195 @@
+"""
+Rates and totals derived from the byte / packet counters of /lte/cellular_stats.
+The router resets these counters every day (and on reboot).
+"""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    COUNTER_SAVE_DELAY,
+    COUNTER_STORAGE_VERSION,
+    COUNTER_WRAP_RATE_FACTOR,
+    DOMAIN,
+)
+from .models import CellularRates, CellularStats, CellularTotals
+
+WRAP_32 = 2**32
+
+
+class CounterTracker:
+    """
+    Follows one counter between timestamped readings and tells an increase from
+    a reset (daily or reboot) and a 32-bit wrap.
+    A drop only counts as a wrap when it is plausible: the counter never read
+    above 32 bits, and the wrapped increase stays within COUNTER_WRAP_RATE_FACTOR
+    times the rate of the previous interval. Any other drop is a reset, a reset
+    near the top of the 32-bit range must not add up to 4 GiB of traffic.
+    """
+
+    __slots__ = ("last", "wide", "_time", "_rate")
+
+    def __init__(self, last: int | None = None, wide: bool = False):
+        self.last = last
+        self.wide = wide  # a reading above 32 bits proves a 64-bit counter
+        self._time = None
+        self._rate = None  # per-second rate of the previous interval
+
+    def update(self, value: int | None, now: float) -> tuple:
+        """
+        Feed a reading, returns (increase, seconds) since the previous one.
+        increase is None when unknown (first or missing reading) and the reading
+        after a reset, seconds is None without a previous timestamp.
+        """
+        if value is None:
+            return None, None
+        previous, since = self.last, self._time
+        self.last, self._time = value, now
+        self.wide = self.wide or value >= WRAP_32
+        if previous is None:
+            return None, None
+        elapsed = now - since if since is not None and now > since else None
+
+        if value >= previous:
+            increase = value - previous
+        elif (
+            not self.wide
+            and elapsed is not None
+            and self._rate is not None
+            and WRAP_32 - previous + value
+            <= COUNTER_WRAP_RATE_FACTOR * self._rate * elapsed
+        ):
+            increase = WRAP_32 - previous + value
+        else:
+            self._rate = None
+            return None, elapsed
+        self._rate = increase / elapsed if elapsed is not None else None
+        return increase, elapsed
+
+
+class CounterRate:
+    """Per-second rate of a counter between two timestamped readings."""
+
+    __slots__ = ("_tracker",)
+
+    def __init__(self):
+        self._tracker = CounterTracker()
+
+    def update(self, value: int | None, now: float) -> float | None:
+        """
+        Rate since the previous reading, None when it cannot be known:
+        first reading, missing value or a counter reset in between
+        (the traffic between the last reading and the reset is lost).
+        """
+        increase, elapsed = self._tracker.update(value, now)
+        if increase is None or elapsed is None:
+            return None
+        return increase / elapsed
+
+
+class CellularStatsRates:
+    """Mbit/s and packets/s from consecutive CellularStats records."""
+
+    def __init__(self):
+        self._rx_bytes = CounterRate()
+        self._tx_bytes = CounterRate()
+        self._rx_packets = CounterRate()
+        self._tx_packets = CounterRate()
+        self.value = None
+
+    def update(self, stats: CellularStats, now: float) -> CellularRates:
+        """Feed a freshly fetched record, `now` being its fetch time."""
+        rx_bytes = self._rx_bytes.update(stats.rx_bytes, now)
+        tx_bytes = self._tx_bytes.update(stats.tx_bytes, now)
+        rx_packets = self._rx_packets.update(stats.rx_packets, now)
+        tx_packets = self._tx_packets.update(stats.tx_packets, now)
+        self.value = CellularRates(
+            rx_mbps=None if rx_bytes is None else round(rx_bytes * 8 / 1e6, 3),
+            tx_mbps=None if tx_bytes is None else round(tx_bytes * 8 / 1e6, 3),
+            rx_pps=None if rx_packets is None else round(rx_packets, 1),
+            tx_pps=None if tx_packets is None else round(tx_packets, 1),
+        )
+        return self.value
+
+
+class CounterAccumulator:
+    """Running total of a counter that resets to zero or wraps at 32 bits."""
+
+    __slots__ = ("tracker", "total")
+
+    def __init__(self, last: int | None = None, total: int = 0, wide: bool = False):
+        self.tracker = CounterTracker(last, wide)
+        self.total = total
+
+    def update(self, value: int | None, now: float) -> int:
+        if value is None:
+            return self.total
+        had_last = self.tracker.last is not None
+        increase, _ = self.tracker.update(value, now)
+        if increase is not None:
+            self.total += increase
+        elif had_last:
+            # reset: everything counted since then is new traffic
+            self.total += value
+        return self.total
+
+
+class CellularStatsTotals:
+    """
+    Lifetime rx / tx byte totals, kept across the router's daily resets and
+    persisted in HA's storage so they survive restarts.
+    """
+
+    FIELDS = ("rx_bytes", "tx_bytes")
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(
+            hass, COUNTER_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.counters"
+        )
+        self._counters = {field: CounterAccumulator() for field in self.FIELDS}
+        self.value = None
+
+    async def async_load(self):
+        data = await self._store.async_load() or {}
+        for field in self.FIELDS:
+            saved = data.get(field)
+            if saved:
+                self._counters[field] = CounterAccumulator(
+                    saved.get("last"), saved.get("total", 0), saved.get("wide", False)
+                )
+        if data:
+            self.value = self._totals()
+
+    def update(self, stats: CellularStats, now: float) -> CellularTotals:
+        """
+        Feed a freshly fetched record, `now` being its fetch time.
+        The write to disk is debounced.
+        """
+        for field, counter in self._counters.items():
+            counter.update(getattr(stats, field), now)
+        self.value = self._totals()
+        self._store.async_delay_save(self._data_to_save, COUNTER_SAVE_DELAY)
+        return self.value
+
+    async def async_save(self):
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self):
+        """Delete the stored totals, the entry is removed for good."""
+        await self._store.async_remove()
+
+    def _totals(self) -> CellularTotals:
+        return CellularTotals(
+            rx_bytes=self._counters["rx_bytes"].total,
+            tx_bytes=self._counters["tx_bytes"].total,
+        )
+
+    def _data_to_save(self) -> dict:
+        return {
+            field: {
+                "last": counter.tracker.last,
+                "total": counter.total,
+                "wide": counter.tracker.wide,
+            }
+            for field, counter in self._counters.items()
+        }
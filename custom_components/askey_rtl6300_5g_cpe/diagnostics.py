@@ -0,0 +1,97 @@
+"""Config entry diagnostics download."""
+
+import ipaddress
+import re
+import time
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_HOST, DOMAIN, REDACT_KEYS
+
+TO_REDACT = REDACT_KEYS | {CONF_HOST}
+
+# candidates for addresses inside free text, e.g. the last error of a request,
+# only the ones ipaddress accepts are redacted
+_IPV4_CANDIDATE = re.compile(r"(?<![\w.])\d{1,3}(?:\.\d{1,3}){3}(?![\w.])")
+_IPV6_CANDIDATE = re.compile(r"(?<![\w:.])[0-9A-Fa-f:.]*:[0-9A-Fa-f:.]*:[0-9A-Fa-f:.]*")
+# international (+, %2B or 00 prefix) numbers anywhere, national numbers and
+# other long digit runs only inside text, a string that is one number is a value
+_PHONE_PREFIXED = re.compile(r"(?:\+|%2B|\b00)\d{6,15}\b")
+_DIGIT_RUN = re.compile(r"\b\d{7,15}\b")
+
+
+def _redact_address(match: re.Match) -> str:
+    token = match.group()
+    # the token may end in punctuation of the sentence, e.g. "fe80::1: timed out"
+    for address in (token, token.rstrip(":."), token.rstrip(".")):
+        try:
+            ipaddress.ip_address(address)
+        except ValueError:
+            continue
+        return REDACTED + token[len(address) :]
+    return token
+
+
+def _scrub_text(text: str) -> str:
+    text = _IPV6_CANDIDATE.sub(_redact_address, text)
+    text = _IPV4_CANDIDATE.sub(_redact_address, text)
+    text = _PHONE_PREFIXED.sub(REDACTED, text)
+    if not text.isdigit():
+        text = _DIGIT_RUN.sub(REDACTED, text)
+    return text
+
+
+def _scrub(value):
+    """Blank addresses and phone numbers in every string of the data."""
+    if isinstance(value, str):
+        return _scrub_text(value)
+    if isinstance(value, dict):
+        return {key: _scrub(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_scrub(item) for item in value]
+    return value
+
+
+def response_shape(payload):
+    """
+    Structure of a raw payload with the values replaced by their type,
+    shows which layout a firmware answers with (e.g. one carrier or a list).
+    """
+    if isinstance(payload, dict):
+        return {key: response_shape(value) for key, value in payload.items()}
+    if isinstance(payload, list):
+        return {
+            "length": len(payload),
+            "item": response_shape(payload[0]) if payload else None,
+        }
+    return type(payload).__name__
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    now = time.monotonic()
+    cache = coordinator.cache
+    payloads = {key: cache.raw(key) for key in cache.as_dict(now)}
+
+    data = {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "requests": coordinator.utils.request_stats,
+        "endpoints": coordinator.utils.endpoint_stats.as_dict(),
+        "last_refresh_timing": coordinator.last_refresh_timing,
+        "refresh_history": list(coordinator.refresh_history),
+        "cache": cache.as_dict(now),
+        "scheduler": {
+            "tiers": coordinator.scheduler.as_dict(now),
+            "adaptive": coordinator.adaptive.as_dict(),
+            "consumers": coordinator.consumers,
+        },
+        "response_shapes": {
+            key: response_shape(payload) for key, payload in payloads.items()
+        },
+        "payloads": payloads,
+    }
+    return _scrub(async_redact_data(data, TO_REDACT))
@@ -0,0 +1,431 @@
+"""
+Typed records for the CPE payloads.
+Every payload is converted once per refresh, sensors only read attributes.
+The router sends every value as a string, "" or "N/A" when it has none.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+
+
+def to_float(raw):
+    """Float of a field, None for missing, unparsable and "nan" / "inf" values."""
+    try:
+        value = float(raw)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def to_int(raw):
+    try:
+        return int(raw)
+    except (ValueError, TypeError):
+        # some integer fields come as "20.000000"
+        value = to_float(raw)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (ValueError, OverflowError):
+            return None
+
+
+def to_str(raw):
+    return raw if raw not in (None, "", "N/A") else None
+
+
+def gigabytes(raw):
+    """Parse the "55.34GB" style values of /traffic/monthly."""
+    try:
+        return to_float(raw.replace("GB", ""))
+    except AttributeError:
+        return None
+
+
+def map_connect_status(connect_status: str):
+    """Map connect_status to a human-readable value."""
+    status_map = {
+        "0": "Connected",
+        "1": "Connecting",
+        "2": "Connect Fail",
+        "3": "Disconnected",
+    }
+    return status_map.get(connect_status, "Unknown")
+
+
+@dataclass(slots=True, frozen=True)
+class Throughput:
+    up: int | None
+    down: int | None
+
+
+@dataclass(slots=True, frozen=True)
+class StatusInfo:
+    sim_status: str | None
+    signal_level: int | None
+    tech_status: str | None
+    plmn_name: str | None
+    roaming: bool
+    network_name: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class SignalInfo:
+    lte_rssi: float | None
+    lte_rsrq: float | None
+    lte_rsrp: float | None
+    lte_sinr: float | None
+    lte_txpwr: float | None
+    nr_rsrp: float | None
+    nr_rsrq: float | None
+    nr_sinr: float | None
+    nr_pci: int | None
+    nr_band: int | None
+    nr_bandw: float | None
+    nr_txpwr: float | None
+    nr_rxch: int | None
+    nr_txch: int | None
+    nr_rxfreq: float | None
+    nr_txfreq: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class ConnectionStatus:
+    """Cellular interface (connectivity_type 1) of /CMGR/v4_status_info or v6_status_info."""
+
+    connect_status: str | None  # raw code, "0" when connected
+    status: str  # human-readable, "Disabled" without a cellular interface
+    ip: str | None
+    gateway: str | None
+    primary_dns: str | None
+    secondary_dns: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class CarrierInfo:
+    pci: int | None
+    rssi: float | None
+    rsrp: float | None
+    rsrq: float | None
+    sinr: float | None
+    band: int | None
+    bandw: float | None
+    rxch: int | None
+    txch: int | None
+    rxfreq: float | None
+    txfreq: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class CellularInfoEx:
+    """Aggregated component carriers, PCC first then SCC1, SCC2..."""
+
+    carriers: tuple[CarrierInfo, ...]
+
+    @property
+    def pcc(self) -> CarrierInfo | None:
+        return self.carriers[0] if self.carriers else None
+
+    @property
+    def scc1(self) -> CarrierInfo | None:
+        # None when no secondary carrier is aggregated
+        return self.carriers[1] if len(self.carriers) > 1 else None
+
+
+@dataclass(slots=True, frozen=True)
+class CarrierAggregation:
+    """Carriers in use and their totals, computed once per poll."""
+
+    carriers: tuple[CarrierInfo, ...]
+    active_carriers: int
+    total_bandwidth: float | None  # MHz, downlink
+    band_mix: str | None  # e.g. "1+3+7", PCC first
+    band_bandwidth: dict  # band -> aggregated MHz
+
+
+@dataclass(slots=True, frozen=True)
+class CellularInfo:
+    type: str | None
+    gci: str | None
+    mcc: str | None
+    mnc: str | None
+    tac: str | None
+    enb: str | None
+    serv_time: int | None
+    cqi: int | None
+    count: int | None
+
+
+@dataclass(slots=True, frozen=True)
+class MessageCount:
+    total: int | None
+
+
+@dataclass(slots=True, frozen=True)
+class CellularStats:
+    tx_bytes: int | None
+    rx_bytes: int | None
+    tx_dropped: int | None
+    rx_dropped: int | None
+    tx_error: int | None
+    rx_error: int | None
+    tx_packets: int | None
+    rx_packets: int | None
+
+
+@dataclass(slots=True, frozen=True)
+class CellularRates:
+    """Computed from the CellularStats counters of two consecutive polls."""
+
+    rx_mbps: float | None
+    tx_mbps: float | None
+    rx_pps: float | None
+    tx_pps: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class CellularTotals:
+    """Bytes since the integration first saw the counters, across resets."""
+
+    rx_bytes: int
+    tx_bytes: int
+
+
+@dataclass(slots=True, frozen=True)
+class SmoothedSignal:
+    """Filtered radio metrics, None while a metric has no filter or no sample."""
+
+    nr_rsrp: float | None
+    nr_rsrq: float | None
+    nr_sinr: float | None
+    pcc_rsrp: float | None
+    pcc_rsrq: float | None
+    pcc_sinr: float | None
+    scc1_rsrp: float | None
+    scc1_rsrq: float | None
+    scc1_sinr: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class TrafficMonthly:
+    rx: float | None  # GB
+    tx: float | None  # GB
+    total: float | None  # GB
+    updated_datetime: str | None
+
+
+def parse_throughput(payload: dict) -> Throughput:
+    return Throughput(up=to_int(payload.get("up")), down=to_int(payload.get("down")))
+
+
+def parse_status_info(payload: dict) -> StatusInfo:
+    return StatusInfo(
+        sim_status=to_str(payload.get("sim_status")),
+        signal_level=to_int(payload.get("signal_level")),
+        tech_status=to_str(payload.get("tech_status")),
+        plmn_name=to_str(payload.get("plmn_name")),
+        roaming=payload.get("roam_status") == "1",
+        network_name=to_str(payload.get("network_name")),
+    )
+
+
+def parse_signal_info(payload: dict) -> SignalInfo:
+    return SignalInfo(
+        lte_rssi=to_float(payload.get("lte_rssi")),
+        lte_rsrq=to_float(payload.get("lte_rsrq")),
+        lte_rsrp=to_float(payload.get("lte_rsrp")),
+        lte_sinr=to_float(payload.get("lte_sinr")),
+        lte_txpwr=to_float(payload.get("lte_txpwr")),
+        nr_rsrp=to_float(payload.get("5g_rsrp")),
+        nr_rsrq=to_float(payload.get("5g_rsrq")),
+        nr_sinr=to_float(payload.get("5g_sinr")),
+        nr_pci=to_int(payload.get("5g_pci")),
+        nr_band=to_int(payload.get("5g_band")),
+        nr_bandw=to_float(payload.get("5g_bandw")),
+        nr_txpwr=to_float(payload.get("5g_txpwr")),
+        nr_rxch=to_int(payload.get("5g_rxch")),
+        nr_txch=to_int(payload.get("5g_txch")),
+        nr_rxfreq=to_float(payload.get("nr5g_rxfreq")),
+        nr_txfreq=to_float(payload.get("nr5g_txfreq")),
+    )
+
+
+def parse_connection_status(payload) -> ConnectionStatus:
+    """The CMGR status endpoints return either one object or a list of them."""
+    items = payload if isinstance(payload, list) else [payload]
+    cellular = next(
+        (
+            item
+            for item in items
+            if isinstance(item, dict) and item.get("connectivity_type") == "1"
+        ),
+        {},
+    )
+    connect_status = cellular.get("connect_status")
+    return ConnectionStatus(
+        connect_status=connect_status,
+        status=map_connect_status(connect_status) if cellular else "Disabled",
+        ip=to_str(cellular.get("ip")),
+        gateway=to_str(cellular.get("gateway")),
+        primary_dns=to_str(cellular.get("primary_dns")),
+        secondary_dns=to_str(cellular.get("secondary_dns")),
+    )
+
+
+def parse_carrier(payload: dict) -> CarrierInfo:
+    return CarrierInfo(
+        pci=to_int(payload.get("pci")),
+        rssi=to_float(payload.get("rssi")),
+        rsrp=to_float(payload.get("rsrp")),
+        rsrq=to_float(payload.get("rsrq")),
+        sinr=to_float(payload.get("sinr")),
+        band=to_int(payload.get("band")),
+        bandw=to_float(payload.get("bandw")),
+        rxch=to_int(payload.get("rxch")),
+        txch=to_int(payload.get("txch")),
+        rxfreq=to_float(payload.get("rxfreq")),
+        txfreq=to_float(payload.get("txfreq")),
+    )
+
+
+def carrier_payloads(payload) -> list[dict]:
+    """
+    Normalize the carrier list of /lte/cellular_info_ex.
+    With only the PCC the result is a bare object, with carrier aggregation
+    it is {"data": [pcc, scc1, ...]}; a bare list or a single object under
+    "data" are accepted as well.
+    """
+    if isinstance(payload, dict) and "data" in payload:
+        payload = payload["data"]
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list):
+        raise TypeError(f"unexpected carrier payload: {type(payload).__name__}")
+    return [item for item in payload if isinstance(item, dict)]
+
+
+def parse_cellular_info_ex(payload) -> CellularInfoEx:
+    return CellularInfoEx(
+        carriers=tuple(parse_carrier(item) for item in carrier_payloads(payload))
+    )
+
+
+def aggregate_carriers(carriers) -> CarrierAggregation:
+    """A carrier counts as active when the router reports its band or bandwidth."""
+    active = [
+        carrier
+        for carrier in carriers
+        if carrier.band is not None or carrier.bandw is not None
+    ]
+    bandwidths = [carrier.bandw for carrier in active if carrier.bandw is not None]
+    band_bandwidth = {}
+    for carrier in active:
+        if carrier.band is not None:
+            band_bandwidth[carrier.band] = band_bandwidth.get(carrier.band, 0.0) + (
+                carrier.bandw or 0.0
+            )
+    return CarrierAggregation(
+        carriers=tuple(carriers),
+        active_carriers=len(active),
+        total_bandwidth=sum(bandwidths) if bandwidths else None,
+        band_mix="+".join(str(band) for band in band_bandwidth) or None,
+        band_bandwidth=band_bandwidth,
+    )
+
+
+# "pcc_band", "scc1_bandw"... flat layout of the carrier fields
+_PREFIXED_FIELD = re.compile(r"^(pcc|scc\d+)_(\w+)$")
+
+
+def parse_cellular_info_ca(payload) -> CarrierAggregation:
+    """
+    No sample of /lte/cellular_info_ca is documented, so both a carrier list
+    (same shapes as cellular_info_ex) and flat pcc_* / scc1_* fields are accepted.
+    """
+    if isinstance(payload, dict) and "data" not in payload:
+        grouped = {}
+        for name, value in payload.items():
+            match = _PREFIXED_FIELD.match(name)
+            if match:
+                grouped.setdefault(match[1], {})[match[2]] = value
+        if grouped:
+            order = sorted(grouped, key=lambda prefix: int(prefix[3:] or 0))
+            return aggregate_carriers(
+                [parse_carrier(grouped[prefix]) for prefix in order]
+            )
+    return aggregate_carriers(
+        [parse_carrier(item) for item in carrier_payloads(payload)]
+    )
+
+
+def derive_carrier_aggregation(cellular_info_ca, cellular_info_ex):
+    """Prefer the CA endpoint, fall back to the carriers of cellular_info_ex."""
+    if cellular_info_ca is not None and cellular_info_ca.active_carriers:
+        return cellular_info_ca
+    if cellular_info_ex is not None:
+        return aggregate_carriers(cellular_info_ex.carriers)
+    return None
+
+
+def parse_cellular_info(payload: dict) -> CellularInfo:
+    return CellularInfo(
+        type=to_str(payload.get("type")),
+        gci=to_str(payload.get("gci")),
+        mcc=to_str(payload.get("mcc")),
+        mnc=to_str(payload.get("mnc")),
+        tac=to_str(payload.get("tac")),
+        enb=to_str(payload.get("enb")),
+        serv_time=to_int(payload.get("serv_time")),
+        cqi=to_int(payload.get("cqi")),
+        count=to_int(payload.get("count")),
+    )
+
+
+def parse_message_count(payload: dict) -> MessageCount:
+    return MessageCount(total=to_int(payload.get("totalcount")))
+
+
+def parse_cellular_stats(payload: dict) -> CellularStats:
+    return CellularStats(
+        tx_bytes=to_int(payload.get("tx_bytes")),
+        rx_bytes=to_int(payload.get("rx_bytes")),
+        tx_dropped=to_int(payload.get("tx_dropped")),
+        rx_dropped=to_int(payload.get("rx_dropped")),
+        tx_error=to_int(payload.get("tx_error")),
+        rx_error=to_int(payload.get("rx_error")),
+        tx_packets=to_int(payload.get("tx_packets")),
+        rx_packets=to_int(payload.get("rx_packets")),
+    )
+
+
+def parse_traffic_monthly(payload: dict) -> TrafficMonthly:
+    return TrafficMonthly(
+        rx=gigabytes(payload.get("rx")),
+        tx=gigabytes(payload.get("tx")),
+        total=gigabytes(payload.get("total")),
+        updated_datetime=to_str(payload.get("updated_datetime")),
+    )
+
+
+# coordinator key -> parser of its payload
+PARSERS = {
+    "throughput": parse_throughput,
+    "status_info": parse_status_info,
+    "signal_info": parse_signal_info,
+    "status_info_v4": parse_connection_status,
+    "status_info_v6": parse_connection_status,
+    "cellular_info_ex": parse_cellular_info_ex,
+    "cellular_info_ca": parse_cellular_info_ca,
+    "cellular_info": parse_cellular_info,
+    "sms_inbox_count": parse_message_count,
+    "sms_outbox_count": parse_message_count,
+    "cellular_stats": parse_cellular_stats,
+    "traffic_monthly": parse_traffic_monthly,
+}
+
+# derived coordinator key -> function of its source records, see DERIVED_KEYS
+DERIVERS = {
+    "carrier_aggregation": derive_carrier_aggregation,
+}
@@ -0,0 +1,136 @@
+import asyncio
+import cProfile
+import logging
+import os
+import pstats
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import PROFILE_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE_DIR = os.path.dirname(__file__)
+
+
+class RefreshProfiler:
+    """
+    cProfile capture of the next refresh cycles of a coordinator, covering
+    _async_update_data and the entity state writes of async_update_listeners.
+    Both are wrapped on the coordinator instance only while a capture runs,
+    a refresh without a capture runs the plain methods.
+    While the refresh awaits the CPE other event loop work is captured as well,
+    the hotspots name the file of every function.
+    """
+
+    def __init__(self, coordinator, cycles: int):
+        self.coordinator = coordinator
+        self.cycles = cycles
+        self.completed = 0
+        self.profile = cProfile.Profile()
+        self._done = None
+
+    async def async_capture(self) -> cProfile.Profile:
+        """Profile the next cycles, or what ran until PROFILE_TIMEOUT."""
+        try:
+            # another profiler (e.g. the profiler integration) may already be active
+            self.profile.enable()
+            self.profile.disable()
+        except ValueError as err:
+            raise HomeAssistantError(f"Cannot start the profiler: {err}") from err
+
+        self._done = self.coordinator.hass.loop.create_future()
+        self._attach()
+        try:
+            async with asyncio.timeout(PROFILE_TIMEOUT):
+                await self._done
+        except TimeoutError:
+            _LOGGER.warning(
+                "Profiled %d of %d refresh cycles before the timeout",
+                self.completed,
+                self.cycles,
+            )
+        finally:
+            self._detach()
+        return self.profile
+
+    def _attach(self):
+        coordinator = self.coordinator
+        update_data = coordinator._async_update_data
+        update_listeners = coordinator.async_update_listeners
+        profile = self.profile
+
+        async def profiled_update_data():
+            profile.enable()
+            try:
+                return await update_data()
+            finally:
+                profile.disable()
+                self.completed += 1
+                if self.completed >= self.cycles:
+                    # after the listeners, which run in the same step of the refresh
+                    coordinator.hass.loop.call_soon(self.finish)
+
+        @callback
+        def profiled_update_listeners():
+            profile.enable()
+            try:
+                update_listeners()
+            finally:
+                profile.disable()
+
+        coordinator._async_update_data = profiled_update_data
+        coordinator.async_update_listeners = profiled_update_listeners
+
+    def _detach(self):
+        # drop the instance attributes, the class methods show through again
+        vars(self.coordinator).pop("_async_update_data", None)
+        vars(self.coordinator).pop("async_update_listeners", None)
+
+    @callback
+    def finish(self):
+        """Stop the capture, the report covers the cycles completed so far."""
+        self._detach()
+        if self._done is not None and not self._done.done():
+            self._done.set_result(None)
+
+
+def _location(filename: str, line: int, function: str) -> str:
+    if filename == "~":  # built-in
+        return function
+    if filename.startswith(_PACKAGE_DIR):
+        filename = os.path.relpath(filename, _PACKAGE_DIR)
+    elif os.sep in filename:
+        filename = os.path.join(*filename.split(os.sep)[-2:])
+    return f"{filename}:{line}({function})"
+
+
+def write_report(profile: cProfile.Profile, path: str, top: int) -> dict:
+    """
+    Write the pstats file and summarize it, run in the executor.
+    Hotspots are ranked by own time, cumulative time includes callees.
+    """
+    profile.dump_stats(path)
+    stats = pstats.Stats(profile).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    total = sum(timing[2] for timing in stats.values())
+    integration = sum(
+        timing[2]
+        for (filename, _, _), timing in stats.items()
+        if filename.startswith(_PACKAGE_DIR)
+    )
+    return {
+        "file": path,
+        "total_ms": round(total * 1000, 2),
+        "integration_ms": round(integration * 1000, 2),
+        "hotspots": [
+            {
+                "function": _location(*function),
+                "calls": calls,
+                "own_ms": round(own * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+            for function, (_, calls, own, cumulative, _) in ranked[:top]
+        ],
+    }
@@ -0,0 +1,279 @@
+import asyncio
+import logging
+import math
+import time
+from array import array
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    ALIGN_DEFAULT_DURATION,
+    ALIGN_MAX_RATE,
+    ALIGN_RTT_SMOOTHING,
+    DOMAIN,
+    SAMPLE_INTERVAL,
+    SAMPLED_METRICS,
+)
+from .models import parse_cellular_info_ex, parse_signal_info
+from .utils import AskeyUtils
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """Fixed-size float buffer, the oldest sample is overwritten once full."""
+
+    __slots__ = ("_values", "_next", "count")
+
+    def __init__(self, size: int):
+        self._values = array("d", bytes(8 * size))
+        self._next = 0
+        self.count = 0
+
+    def append(self, value: float):
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self.count = min(self.count + 1, len(self._values))
+
+    def values(self) -> list:
+        """Samples in the buffer, in no particular order."""
+        return self._values[: self.count].tolist()
+
+    def clear(self):
+        self._next = 0
+        self.count = 0
+
+
+@dataclass(slots=True, frozen=True)
+class WindowStats:
+    min: float
+    max: float
+    mean: float
+    p5: float
+    p95: float
+    samples: int
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def window_stats(values: list) -> WindowStats | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return WindowStats(
+        min=ordered[0],
+        max=ordered[-1],
+        mean=round(sum(ordered) / len(ordered), 2),
+        p5=_percentile(ordered, 0.05),
+        p95=_percentile(ordered, 0.95),
+        samples=len(ordered),
+    )
+
+
+class AskeySignalSampler(DataUpdateCoordinator):
+    """
+    Opt-in high-rate sampler of /lte/signal_info.
+    Samples go into one ring buffer per metric, entities only get the
+    aggregates of each window so the recorder sees one state per window.
+    """
+
+    def __init__(self, hass: HomeAssistant, utils: AskeyUtils, window: int):
+        self.utils = utils
+        self.window = window
+        size = max(int(window / SAMPLE_INTERVAL), 1)
+        self._buffers = {metric: RingBuffer(size) for metric in SAMPLED_METRICS}
+        self._window_start = None
+        self._sampling = False
+        self.samples_skipped = 0
+        # sensor key -> WriteCounter of its state writes
+        self.state_writes = {}
+        # no update_interval, data is pushed with async_set_updated_data
+        super().__init__(hass, _LOGGER, name=f"{DOMAIN}_sampler")
+
+    @callback
+    def async_start(self):
+        """Start sampling, returns the callback that stops it."""
+        self._window_start = time.monotonic()
+        return async_track_time_interval(
+            self.hass,
+            self._async_sample,
+            timedelta(seconds=SAMPLE_INTERVAL),
+            name=f"{DOMAIN} signal sampler",
+        )
+
+    async def _async_sample(self, _now=None):
+        # a slow answer must not pile up requests against the CPE
+        if self._sampling:
+            self.samples_skipped += 1
+            return
+        self._sampling = True
+        try:
+            async with asyncio.timeout(SAMPLE_INTERVAL * 5):
+                payload = await self.utils.get("/lte/signal_info")
+        except TimeoutError:
+            payload = None
+        finally:
+            self._sampling = False
+
+        if payload is not None:
+            try:
+                signal = parse_signal_info(payload)
+            except (KeyError, TypeError, AttributeError) as err:
+                _LOGGER.debug("Unexpected signal_info sample %s: %s", payload, err)
+            else:
+                for metric, buffer in self._buffers.items():
+                    value = getattr(signal, metric)
+                    if value is not None:
+                        buffer.append(value)
+
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._publish_window()
+
+    def _publish_window(self):
+        stats = {
+            metric: window_stats(buffer.values())
+            for metric, buffer in self._buffers.items()
+        }
+        for buffer in self._buffers.values():
+            buffer.clear()
+        self.async_set_updated_data(stats)
+
+
+# SignalInfo fields reported by align_antenna, plus the PCC of cellular_info_ex
+ALIGN_METRICS = ("nr_rsrp", "nr_sinr", "lte_rsrp", "lte_sinr")
+# best position: highest SINR of the first metric reported, ties broken by RSRP
+ALIGN_RANKING = (
+    ("nr_sinr", "nr_rsrp"),
+    ("lte_sinr", "lte_rsrp"),
+    ("pcc_sinr", "pcc_rsrp"),
+)
+
+
+class AntennaAligner:
+    """
+    Runs the align_antenna service.
+    Samples /lte/signal_info and /lte/cellular_info_ex back to back with one
+    pair of requests in flight, spaced to the smoothed round-trip so the rate
+    follows what the CPE sustains. The coordinator schedule is left alone.
+    """
+
+    def __init__(self, utils: AskeyUtils):
+        self.utils = utils
+        self._lock = asyncio.Lock()
+
+    async def handle_align_antenna(self, call: ServiceCall) -> dict:
+        """Handle the align_antenna service call."""
+        if self._lock.locked():
+            raise HomeAssistantError("An antenna alignment is already running")
+        async with self._lock:
+            return await self.async_run(
+                call.data.get("duration", ALIGN_DEFAULT_DURATION)
+            )
+
+    async def _async_sample(self) -> dict | None:
+        signal_payload, carriers_payload = await asyncio.gather(
+            self.utils.get("/lte/signal_info"),
+            self.utils.get("/lte/cellular_info_ex"),
+        )
+        values = {}
+        try:
+            if signal_payload is not None:
+                signal = parse_signal_info(signal_payload)
+                values.update(
+                    (metric, getattr(signal, metric)) for metric in ALIGN_METRICS
+                )
+            if carriers_payload is not None:
+                pcc = parse_cellular_info_ex(carriers_payload).pcc
+                if pcc is not None:
+                    values.update(pcc_rsrp=pcc.rsrp, pcc_sinr=pcc.sinr)
+        except (KeyError, IndexError, TypeError, AttributeError) as err:
+            _LOGGER.debug("Unexpected alignment sample: %s", err)
+        return values or None
+
+    async def async_run(self, duration: int) -> dict:
+        start = time.monotonic()
+        deadline = start + duration
+        # second since start -> metric -> values
+        seconds = defaultdict(lambda: defaultdict(list))
+        samples = errors = 0
+        round_trip = None
+
+        # stops early when the entry unloads and its client is closed
+        while (sent := time.monotonic()) < deadline and not self.utils.closed:
+            values = await self._async_sample()
+            elapsed = time.monotonic() - sent
+            round_trip = (
+                elapsed
+                if round_trip is None
+                else round_trip + ALIGN_RTT_SMOOTHING * (elapsed - round_trip)
+            )
+            if values is None:
+                errors += 1
+                # the CPE did not answer, give it a moment before the next try
+                await asyncio.sleep(min(SAMPLE_INTERVAL, max(deadline - sent, 0)))
+                continue
+            samples += 1
+            bucket = seconds[int(sent - start)]
+            for metric, value in values.items():
+                if value is not None:
+                    bucket[metric].append(value)
+            await asyncio.sleep(max(max(1 / ALIGN_MAX_RATE, round_trip) - elapsed, 0))
+
+        elapsed = time.monotonic() - start
+        per_second = [
+            {
+                "second": second,
+                "samples": max(len(values) for values in bucket.values()),
+                **{
+                    metric: round(sum(values) / len(values), 2)
+                    for metric, values in bucket.items()
+                },
+            }
+            for second, bucket in sorted(seconds.items())
+            if bucket
+        ]
+        overall = {}
+        for bucket in seconds.values():
+            for metric, values in bucket.items():
+                overall.setdefault(metric, []).extend(values)
+
+        return {
+            "duration": round(elapsed, 1),
+            "samples": samples,
+            "errors": errors,
+            "samples_per_second": round(samples / elapsed, 2) if elapsed else 0,
+            "sustained_rate": (
+                round(min(1 / round_trip, ALIGN_MAX_RATE), 2) if round_trip else 0
+            ),
+            "per_second": per_second,
+            "overall": {
+                metric: asdict(window_stats(values))
+                for metric, values in overall.items()
+            },
+            "best": _best_position(per_second),
+        }
+
+
+def _best_position(per_second: list) -> dict | None:
+    """The second with the best signal, ranked by the first SINR metric available."""
+    for sinr, rsrp in ALIGN_RANKING:
+        ranked = [second for second in per_second if sinr in second]
+        if ranked:
+            best = max(
+                ranked,
+                key=lambda second: (second[sinr], second.get(rsrp, -math.inf)),
+            )
+            return {"ranked_by": sinr, **best}
+    return None
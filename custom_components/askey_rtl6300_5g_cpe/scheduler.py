@@ -0,0 +1,140 @@
+class TierScheduler:
+    """
+    Decides which endpoint groups are due on a coordinator tick.
+    Each tier is a (interval_seconds, coordinator_keys) pair.
+    """
+
+    def __init__(self, tiers: dict):
+        self.tiers = tiers
+        self._last_run = dict.fromkeys(tiers)
+
+    @property
+    def tick(self) -> float:
+        """Shortest tier interval, the rate the coordinator has to run at."""
+        return min(interval for interval, _ in self.tiers.values())
+
+    def due(self, now: float, force: bool = False, always=()) -> list:
+        """
+        Return the tiers that should be fetched at monotonic time `now`.
+        Tiers listed in `always` are due on every tick.
+        """
+        # half a tick of slack so timer jitter does not push a tier to the next tick
+        slack = self.tick / 2
+        return [
+            name
+            for name, (interval, _) in self.tiers.items()
+            if force
+            or name in always
+            or self._last_run[name] is None
+            or now - self._last_run[name] + slack >= interval
+        ]
+
+    def keys(self, tiers) -> list:
+        """Coordinator keys belonging to the given tiers."""
+        return [key for name in tiers for key in self.tiers[name][1]]
+
+    def mark_run(self, tiers, now: float):
+        for name in tiers:
+            self._last_run[name] = now
+
+    def as_dict(self, now: float) -> dict:
+        """Seconds since each tier was last fetched, for diagnostics."""
+        return {
+            name: {
+                "interval": interval,
+                "age": (
+                    None
+                    if self._last_run[name] is None
+                    else round(now - self._last_run[name], 1)
+                ),
+            }
+            for name, (interval, _) in self.tiers.items()
+        }
+
+
+class AdaptiveIntervalController:
+    """
+    Picks the coordinator interval from the health of the CPE.
+    Backs off exponentially while nothing answers, bursts after the connection
+    leaves "Connected" or SINR drops sharply, and returns to the base rate once stable.
+    """
+
+    MODE_NORMAL = "normal"
+    MODE_BACKOFF = "backoff"
+    MODE_BURST = "burst"
+
+    def __init__(
+        self,
+        base_interval: float,
+        max_backoff: float,
+        burst_interval: float,
+        burst_duration: float,
+        sinr_drop: float,
+    ):
+        self.base_interval = base_interval
+        self.max_backoff = max_backoff
+        self.burst_interval = burst_interval
+        self.burst_duration = burst_duration
+        self.sinr_drop = sinr_drop
+
+        self.interval = base_interval
+        self.mode = self.MODE_NORMAL
+        self.failures = 0
+        self._burst_until = None
+        self._last_connect_status = None
+        self._last_sinr = {}
+
+    @property
+    def bursting(self) -> bool:
+        return self.mode == self.MODE_BURST
+
+    def update(
+        self, now: float, reachable: bool, connect_status=None, sinr=None
+    ) -> float:
+        """
+        Feed the outcome of one refresh and return the next interval.
+        `sinr` maps a metric name to its latest value in dB.
+        """
+        if not reachable:
+            self.failures += 1
+            self.mode = self.MODE_BACKOFF
+            self.interval = min(self.base_interval * 2**self.failures, self.max_backoff)
+            return self.interval
+
+        self.failures = 0
+        if self._degraded(connect_status, sinr or {}):
+            self._burst_until = now + self.burst_duration
+
+        if self._burst_until is not None and now < self._burst_until:
+            self.mode = self.MODE_BURST
+            self.interval = min(self.burst_interval, self.base_interval)
+        else:
+            self._burst_until = None
+            self.mode = self.MODE_NORMAL
+            self.interval = self.base_interval
+        return self.interval
+
+    def _degraded(self, connect_status, sinr: dict) -> bool:
+        degraded = False
+
+        if connect_status is not None:
+            if self._last_connect_status == "0" and connect_status != "0":
+                degraded = True
+            self._last_connect_status = connect_status
+
+        for name, value in sinr.items():
+            if value is None:
+                continue
+            last = self._last_sinr.get(name)
+            if last is not None and last - value >= self.sinr_drop:
+                degraded = True
+            self._last_sinr[name] = value
+
+        return degraded
+
+    def as_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "interval": self.interval,
+            "failures": self.failures,
+        }
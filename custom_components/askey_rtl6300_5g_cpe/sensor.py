@@ -1,197 +1,89 @@
 import logging
 
-from custom_components.askey_rtl6300_5g_cpe.sensors.signal_info import (
-    Askey5gRsrpSensor,
-    Askey5gRsrqSensor,
-    Askey5gSinrSensor,
-    Askey5gPciSensor,
-    Askey5gBandSensor,
-    Askey5gBandwidthSensor,
-    Askey5gTxPowerSensor,
-    Askey5gRxChannelSensor,
-    Askey5gTxChannelSensor,
-    Askey5gRxFrequencySensor,
-    Askey5gTxFrequencySensor,
-)
-from custom_components.askey_rtl6300_5g_cpe.sensors.cellular_info import (
-    AskeyPccTypeSensor,
-    AskeyPccGciSensor,
-    AskeyPccMccSensor,
-    AskeyPccMncSensor,
-    AskeyPccTacSensor,
-    AskeyPccEnbSensor,
-    AskeyPccCqiSensor,
-    AskeyPccCountSensor,
-)
-from custom_components.askey_rtl6300_5g_cpe.sensors.status_info import (
-    AskeyNetworkNameSensor,
-    AskeySignalLevelSensor,
-    AskeyRoamingSensor,
-)
-from custom_components.askey_rtl6300_5g_cpe.sensors.traffic import (
-    AskeyMonthlyRxSensor,
-    AskeyMonthlyTxSensor,
-    AskeyMonthlyTotalSensor,
-    AskeyMonthlyUpdatedDatetimeSensor,
-)
-
-from .sensors.cellular_stats import (
-    AskeyTxBytesSensor,
-    AskeyRxBytesSensor,
-    AskeyTxDroppedSensor,
-    AskeyRxDroppedSensor,
-    AskeyTxErrorSensor,
-    AskeyRxErrorSensor,
-    AskeyTxPacketsSensor,
-    AskeyRxPacketsSensor,
-)
-from .sensors.pcc_cell_info import (
-    AskeyPccPciSensor,
-    AskeyPccRssiSensor,
-    AskeyPccRsrpSensor,
-    AskeyPccRsrqSensor,
-    AskeyPccSinrSensor,
-    AskeyPccBandSensor,
-    AskeyPccBandwSensor,
-    AskeyPccRxchSensor,
-    AskeyPccTxchSensor,
-    AskeyPccRxfreqSensor,
-    AskeyPccTxfreqSensor,
-)
-
-from .sensors.scc1_cell_info import (
-    AskeyScc1PciSensor,
-    AskeyScc1RssiSensor,
-    AskeyScc1RsrpSensor,
-    AskeyScc1RsrqSensor,
-    AskeyScc1SinrSensor,
-    AskeyScc1BandSensor,
-    AskeyScc1BandwSensor,
-    AskeyScc1RxchSensor,
-    AskeyScc1TxchSensor,
-    AskeyScc1RxfreqSensor,
-    AskeyScc1TxfreqSensor,
-)
-
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .sensors.sms_count import AskeySmsInboxCountSensor, AskeySmsOutboxCountSensor
-
-from .sensors.status_info_sensor_v6 import (
-    AskeyConnectivityGatewaySensorV6,
-    AskeyConnectivityPrimaryDNSSensorV6,
-    AskeyConnectivitySecondaryDNSSensorV6,
-    AskeyConnectivityStatusSensorV6,
-    AskeyConnectivityIpSensorV6,
-)
+from .const import DOMAIN
+from .sensors.base_sensor import AskeySensor
+from .sensors.carrier_aggregation import CARRIER_AGGREGATION_SENSORS
+from .sensors.carrier_info import CARRIER_SENSORS, carrier_sensors
+from .sensors.cellular_info import CELLULAR_INFO_SENSORS
+from .sensors.cellular_stats import CELLULAR_STATS_SENSORS
+from .sensors.endpoint_stats import ENDPOINT_STATS_SENSORS
+from .sensors.polling import POLLING_SENSORS
+from .sensors.sampled_signal import AskeySampledSensor, SAMPLED_SIGNAL_SENSORS
+from .sensors.smoothed_signal import SMOOTHED_SIGNAL_SENSORS
+from .sensors.signal_info import LTE_SIGNAL_FIELD_SET, SIGNAL_INFO_SENSORS
+from .sensors.sms_count import SMS_COUNT_SENSORS
+from .sensors.status_info import STATUS_INFO_SENSORS
+from .sensors.status_info_sensor_v4 import STATUS_INFO_V4_SENSORS
+from .sensors.status_info_sensor_v6 import STATUS_INFO_V6_SENSORS
+from .sensors.throughput_sensor import THROUGHPUT_SENSORS
+from .sensors.traffic import TRAFFIC_SENSORS
 
+_LOGGER = logging.getLogger(__name__)
 
-from .sensors.status_info_sensor_v4 import (
-    AskeyConnectivityGatewaySensorV4,
-    AskeyConnectivityPrimaryDNSSensorV4,
-    AskeyConnectivitySecondaryDNSSensorV4,
-    AskeyConnectivityStatusSensorV4,
-    AskeyConnectivityIpSensorV4,
+SENSORS = (
+    *THROUGHPUT_SENSORS,
+    *STATUS_INFO_V6_SENSORS,
+    *STATUS_INFO_V4_SENSORS,
+    *SMS_COUNT_SENSORS,
+    *CARRIER_SENSORS,
+    *CARRIER_AGGREGATION_SENSORS,
+    *CELLULAR_STATS_SENSORS,
+    *TRAFFIC_SENSORS,
+    *CELLULAR_INFO_SENSORS,
+    *STATUS_INFO_SENSORS,
+    *SIGNAL_INFO_SENSORS,
+    *SMOOTHED_SIGNAL_SENSORS,
+    *POLLING_SENSORS,
+    *ENDPOINT_STATS_SENSORS,
 )
 
-from .sensors.throughput_sensor import (
-    AskeyThroughputDownloadSensor,
-    AskeyThroughputUploadSensor,
-)
-from .const import DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
+# firmware dependent sensors, added only when the first refresh has their fields
+FIELD_SETS = (LTE_SIGNAL_FIELD_SET,)
 
 
 # Setup entry for sensors
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up sensors from a config entry."""
+    # initial data was fetched by async_config_entry_first_refresh during setup
     coordinator: DataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Ensure initial data is available
-    await coordinator.async_request_refresh()
+    descriptions = list(SENSORS)
+    for field_set in FIELD_SETS:
+        if field_set.supported_fn(coordinator.data):
+            descriptions.extend(field_set.sensors)
+        else:
+            _LOGGER.debug("Firmware does not report %s fields", field_set.name)
 
-    # Add all sensors
     async_add_entities(
-        [
-            # "Throughput"
-            AskeyThroughputDownloadSensor(coordinator),
-            AskeyThroughputUploadSensor(coordinator),
-            # IP v6
-            AskeyConnectivityStatusSensorV6(coordinator),
-            AskeyConnectivityIpSensorV6(coordinator),
-            AskeyConnectivityGatewaySensorV6(coordinator),
-            AskeyConnectivityPrimaryDNSSensorV6(coordinator),
-            AskeyConnectivitySecondaryDNSSensorV6(coordinator),
-            # IP v4
-            AskeyConnectivityGatewaySensorV4(coordinator),
-            AskeyConnectivityPrimaryDNSSensorV4(coordinator),
-            AskeyConnectivitySecondaryDNSSensorV4(coordinator),
-            AskeyConnectivityStatusSensorV4(coordinator),
-            AskeyConnectivityIpSensorV4(coordinator),
-            # SMS
-            AskeySmsInboxCountSensor(coordinator),
-            AskeySmsOutboxCountSensor(coordinator),
-            AskeyPccPciSensor(coordinator),
-            AskeyPccRssiSensor(coordinator),
-            AskeyPccRsrpSensor(coordinator),
-            AskeyPccRsrqSensor(coordinator),
-            AskeyPccSinrSensor(coordinator),
-            AskeyPccBandSensor(coordinator),
-            AskeyPccBandwSensor(coordinator),
-            AskeyPccRxchSensor(coordinator),
-            AskeyPccTxchSensor(coordinator),
-            AskeyPccRxfreqSensor(coordinator),
-            AskeyPccTxfreqSensor(coordinator),
-            AskeyScc1PciSensor(coordinator),
-            AskeyScc1RssiSensor(coordinator),
-            AskeyScc1RsrpSensor(coordinator),
-            AskeyScc1RsrqSensor(coordinator),
-            AskeyScc1SinrSensor(coordinator),
-            AskeyScc1BandSensor(coordinator),
-            AskeyScc1BandwSensor(coordinator),
-            AskeyScc1RxchSensor(coordinator),
-            AskeyScc1TxchSensor(coordinator),
-            AskeyScc1RxfreqSensor(coordinator),
-            AskeyScc1TxfreqSensor(coordinator),
-            # Traffic statistics
-            AskeyTxBytesSensor(coordinator),
-            AskeyRxBytesSensor(coordinator),
-            AskeyTxDroppedSensor(coordinator),
-            AskeyRxDroppedSensor(coordinator),
-            AskeyTxErrorSensor(coordinator),
-            AskeyRxErrorSensor(coordinator),
-            AskeyTxPacketsSensor(coordinator),
-            AskeyRxPacketsSensor(coordinator),
-            AskeyMonthlyRxSensor(coordinator),
-            AskeyMonthlyTxSensor(coordinator),
-            AskeyMonthlyTotalSensor(coordinator),
-            AskeyMonthlyUpdatedDatetimeSensor(coordinator),
-            # Basic info
-            AskeyPccTypeSensor(coordinator),
-            AskeyPccGciSensor(coordinator),
-            AskeyPccMccSensor(coordinator),
-            AskeyPccMncSensor(coordinator),
-            AskeyPccTacSensor(coordinator),
-            AskeyPccEnbSensor(coordinator),
-            AskeyNetworkNameSensor(coordinator),
-            AskeySignalLevelSensor(coordinator),
-            AskeyRoamingSensor(coordinator),
-            # 5G
-            Askey5gRsrpSensor(coordinator),
-            Askey5gRsrqSensor(coordinator),
-            Askey5gSinrSensor(coordinator),
-            Askey5gPciSensor(coordinator),
-            Askey5gBandSensor(coordinator),
-            Askey5gBandwidthSensor(coordinator),
-            Askey5gTxPowerSensor(coordinator),
-            Askey5gRxChannelSensor(coordinator),
-            Askey5gTxChannelSensor(coordinator),
-            Askey5gRxFrequencySensor(coordinator),
-            Askey5gTxFrequencySensor(coordinator),
-            # no idea how this is calculated
-            # AskeyPccServTimeSensor(coordinator),
-            AskeyPccCqiSensor(coordinator),
-            AskeyPccCountSensor(coordinator),
-        ]
+        AskeySensor(coordinator, description) for description in descriptions
     )
+
+    if coordinator.sampler is not None:
+        async_add_entities(
+            AskeySampledSensor(coordinator.sampler, description)
+            for description in SAMPLED_SIGNAL_SENSORS
+        )
+
+    # PCC and SCC1 sensors always exist, later carriers get theirs when first seen
+    known_carriers = 2
+
+    @callback
+    def _async_add_carriers():
+        nonlocal known_carriers
+        info = (coordinator.data or {}).get("cellular_info_ex")
+        count = len(info.carriers) if info is not None else 0
+        if count <= known_carriers:
+            return
+        _LOGGER.debug("Router aggregates %s carriers, adding sensors", count)
+        async_add_entities(
+            AskeySensor(coordinator, description)
+            for index in range(known_carriers, count)
+            for description in carrier_sensors(index)
+        )
+        known_carriers = count
+
+    _async_add_carriers()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_carriers))
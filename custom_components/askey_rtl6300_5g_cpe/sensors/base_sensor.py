@@ -1,19 +1,124 @@
-from homeassistant.components.sensor import SensorEntity
-from ..const import DOMAIN
-from homeassistant.helpers.entity import EntityCategory
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from ..const import DEFAULT_MAX_SILENCE, DOMAIN
+from ..utils import compile_accessor
 
-class AskeyBaseSensor(SensorEntity):
-    """Base class for ASKEY sensors."""
 
-    def __init__(self, coordinator, name, unique_id, icon, value_key, unit=None):
-        self.coordinator = coordinator
-        self._attr_name = name
-        self._attr_unique_id = unique_id
-        self._attr_icon = icon
-        self._attr_native_unit_of_measurement = unit
-        self.value_key = value_key
-        self._attr_has_entity_name = True
+@dataclass(frozen=True, kw_only=True)
+class AskeySensorEntityDescription(SensorEntityDescription):
+    """
+    Describes one ASKEY sensor, key is the unique_id.
+    The value is read from coordinator.data at value_path (coordinator key first)
+    and converted by value_mapper, or computed from the coordinator by value_fn.
+    With a deadband the state is only written when the value moves by at least
+    that much, or max_silence seconds after the last write.
+    """
+
+    value_path: tuple = ()
+    value_mapper: Callable[[Any], Any] | None = None
+    value_fn: Callable[[Any], Any] | None = None
+    attributes: dict | None = None
+    attributes_fn: Callable[[Any], dict] | None = None
+    deadband: float | None = None
+    max_silence: float = DEFAULT_MAX_SILENCE
+
+    @property
+    def coordinator_keys(self):
+        """Coordinator keys (endpoints) the sensor reads, only these get polled."""
+        return self.value_path[:1]
+
+
+class WriteCounter:
+    """State writes of one sensor, emitted and held back by its deadband."""
+
+    __slots__ = ("emitted", "suppressed")
+
+    def __init__(self):
+        self.emitted = 0
+        self.suppressed = 0
+
+
+@dataclass(frozen=True)
+class AskeyFieldSet:
+    """
+    Sensors for fields only some firmwares report.
+    Added at setup when supported_fn(coordinator.data) is true.
+    """
+
+    name: str
+    supported_fn: Callable[[dict], bool]
+    sensors: tuple
+
+
+class AskeySensor(CoordinatorEntity, SensorEntity):
+    """
+    ASKEY sensor driven by an AskeySensorEntityDescription.
+    State is pushed by the coordinator after every refresh, entities never poll.
+    """
+
+    entity_description: AskeySensorEntityDescription
+    _attr_has_entity_name = True
+    # static text, not worth a copy in the recorder with every state
+    _unrecorded_attributes = frozenset({"Description", "Unit"})
+
+    def __init__(self, coordinator, description: AskeySensorEntityDescription):
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = description.key
+        # coordinator.state_writes: sensor key -> WriteCounter, for tuning deadbands
+        self._writes = coordinator.state_writes.setdefault(
+            description.key, WriteCounter()
+        )
+        self._written_value = None
+        self._written_available = None
+        self._written_at = None
+        if description.value_fn is not None:
+            self._get_value = description.value_fn
+        else:
+            accessor = compile_accessor(
+                description.value_path, description.value_mapper
+            )
+            self._get_value = lambda coordinator: accessor(coordinator.data)
+
+    @property
+    def native_value(self):
+        return self._get_value(self.coordinator)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the state unless the change stays within the deadband."""
+        deadband = self.entity_description.deadband
+        if deadband is not None:
+            value = self.native_value
+            available = self.available
+            now = time.monotonic()
+            if (
+                self._written_at is not None
+                and available == self._written_available
+                and value is not None
+                and self._written_value is not None
+                and abs(value - self._written_value) < deadband
+                and now - self._written_at < self.entity_description.max_silence
+            ):
+                self._writes.suppressed += 1
+                return
+            self._written_value = value
+            self._written_available = available
+            self._written_at = now
+        self._writes.emitted += 1
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self):
+        if self.entity_description.attributes_fn is not None:
+            return self.entity_description.attributes_fn(self.coordinator)
+        return self.entity_description.attributes
 
     @property
     def device_info(self):
@@ -25,14 +130,16 @@ class AskeyBaseSensor(SensorEntity):
             "model": "5G Home Router",
         }
 
-    async def async_update(self):
-        """Request data refresh from coordinator."""
-        await self.coordinator.async_request_refresh()
-
-
-class AskeyBaseSensorDiagnostic(AskeyBaseSensor):
-    """Base class for ASKEY sensors."""
+    @property
+    def available(self):
+        """Unavailable only while an endpoint this sensor reads is stale."""
+        return self.coordinator.is_fresh(self.entity_description.coordinator_keys)
 
-    def __init__(self, coordinator, name, unique_id, icon, value_key, unit=None):
-        super().__init__(coordinator, name, unique_id, icon, value_key, unit)
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+    async def async_added_to_hass(self):
+        """Tell the coordinator which endpoints this enabled sensor needs."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_consumer(
+                self.entity_description.coordinator_keys
+            )
+        )
@@ -0,0 +1,52 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+
+from .base_sensor import AskeySensorEntityDescription
+
+# Computed by the coordinator from /lte/cellular_info_ca, or from the carriers
+# of /lte/cellular_info_ex when the CA endpoint has nothing usable.
+
+
+def _band_mix_attributes(coordinator):
+    aggregation = (coordinator.data or {}).get("carrier_aggregation")
+    return {
+        "Description": "Bands currently aggregated, primary carrier first.",
+        "Unit": "None",
+        "Bandwidth per band": (
+            {} if aggregation is None else dict(aggregation.band_bandwidth)
+        ),
+    }
+
+
+CARRIER_AGGREGATION_SENSORS = (
+    AskeySensorEntityDescription(
+        key="askey_ca_bandwidth",
+        name="Aggregated Bandwidth",
+        icon="mdi:arrow-expand-horizontal",
+        native_unit_of_measurement="MHz",
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("carrier_aggregation", "total_bandwidth"),
+        attributes={
+            "Description": "Total downlink bandwidth of all aggregated carriers in megahertz (MHz).",
+            "Unit": "MHz",
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_ca_carriers",
+        name="Active Carriers",
+        icon="mdi:radio-tower",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("carrier_aggregation", "active_carriers"),
+        attributes={
+            "Description": "Number of component carriers in use, 1 without carrier aggregation.",
+            "Unit": "None",
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_ca_band_mix",
+        name="Band Mix",
+        icon="mdi:layers-triple",
+        value_path=("carrier_aggregation", "band_mix"),
+        attributes_fn=_band_mix_attributes,
+    ),
+)
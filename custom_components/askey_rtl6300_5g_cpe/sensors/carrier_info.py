@@ -0,0 +1,119 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.helpers.entity import EntityCategory
+
+from ..const import SIGNAL_DEADBANDS
+from .base_sensor import AskeySensorEntityDescription
+
+# field, name, icon, unit, description ({label} is PCC, SCC1, SCC2...)
+CARRIER_FIELDS = (
+    (
+        "pci",
+        "PCI",
+        "mdi:network",
+        None,
+        "Physical Cell Identity (PCI) of {label} used to identify cells within the network.",
+    ),
+    (
+        "rssi",
+        "RSSI",
+        "mdi:signal",
+        "dBm",
+        "Received Signal Strength Indicator (RSSI) of {label}. A measure of the power level being received by the device.",
+    ),
+    (
+        "rsrp",
+        "RSRP",
+        "mdi:signal",
+        "dBm",
+        "Reference Signal Received Power (RSRP) of {label}. Indicates the strength of the reference signal.",
+    ),
+    (
+        "rsrq",
+        "RSRQ",
+        "mdi:signal",
+        "dB",
+        "Reference Signal Received Quality (RSRQ) of {label}. A measure of signal quality combining signal strength and interference.",
+    ),
+    (
+        "sinr",
+        "SINR",
+        "mdi:signal",
+        "dB",
+        "Signal to Interference plus Noise Ratio (SINR) of {label}. Measures the quality of the signal relative to interference and noise.",
+    ),
+    ("band", "Band", "mdi:network", None, "Cellular frequency band of {label}."),
+    (
+        "bandw",
+        "Bandwidth",
+        "mdi:network",
+        "MHz",
+        "Bandwidth of {label} in megahertz (MHz).",
+    ),
+    ("rxch", "RX Channel", "mdi:radio-tower", None, "Receive Channel for {label}."),
+    ("txch", "TX Channel", "mdi:radio-tower", None, "Transmit Channel for {label}."),
+    (
+        "rxfreq",
+        "RX Freq",
+        "mdi:radio-tower",
+        "MHz",
+        "Receive Frequency for {label} in megahertz (MHz).",
+    ),
+    (
+        "txfreq",
+        "TX Freq",
+        "mdi:radio-tower",
+        "MHz",
+        "Transmit Frequency for {label} in megahertz (MHz).",
+    ),
+)
+
+# measured fields, the others (PCI, band, channels) are identifiers
+CARRIER_DEVICE_CLASSES = {
+    "rssi": SensorDeviceClass.SIGNAL_STRENGTH,
+    "rsrp": SensorDeviceClass.SIGNAL_STRENGTH,
+    "rsrq": SensorDeviceClass.SIGNAL_STRENGTH,
+    "sinr": SensorDeviceClass.SIGNAL_STRENGTH,
+    "bandw": SensorDeviceClass.FREQUENCY,
+    "rxfreq": SensorDeviceClass.FREQUENCY,
+    "txfreq": SensorDeviceClass.FREQUENCY,
+}
+
+
+def carrier_label(index: int) -> str:
+    """PCC for the primary carrier, SCC1, SCC2... for the aggregated ones."""
+    return "PCC" if index == 0 else f"SCC{index}"
+
+
+def carrier_sensors(index: int) -> tuple:
+    """
+    Sensors of one component carrier of /lte/cellular_info_ex.
+    Secondary carriers are not always present, their values are None while
+    the router does not aggregate them.
+    """
+    label = carrier_label(index)
+    return tuple(
+        AskeySensorEntityDescription(
+            key=f"askey_{label.lower()}_{field}",
+            name=f"{label} {name}",
+            icon=icon,
+            native_unit_of_measurement=unit,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=CARRIER_DEVICE_CLASSES.get(field),
+            state_class=(
+                SensorStateClass.MEASUREMENT
+                if field in CARRIER_DEVICE_CLASSES
+                else None
+            ),
+            deadband=SIGNAL_DEADBANDS.get(field),
+            value_path=("cellular_info_ex", "carriers", index, field),
+            attributes={
+                "Description": description.format(label=label),
+                "Unit": unit or "None",
+            },
+        )
+        for field, name, icon, unit, description in CARRIER_FIELDS
+    )
+
+
+# PCC and SCC1 always exist, SCC2+ are added once the router aggregates them
+CARRIER_SENSORS = carrier_sensors(0) + carrier_sensors(1)
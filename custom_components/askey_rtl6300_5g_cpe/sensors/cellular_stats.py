@@ -1,238 +1,187 @@
-from custom_components.askey_rtl6300_5g_cpe.utils import (
-    bytes_to_gib,
-    safe_get_property,
-)
-from .base_sensor import AskeyBaseSensor, AskeyBaseSensorDiagnostic
-from homeassistant.const import UnitOfInformation
-
-
-class AskeyTxBytesSensor(AskeyBaseSensor):
-    """
-    Tracks the amount of data sent in last 24 hours(ish).
-    Data is sent in bytes and converted to GiB.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Current Upload",
-            "askey_upload",
-            "mdi:upload",
-            "upload",
-            UnitOfInformation.GIBIBYTES,
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data,
-            ["cellular_stats", "tx_bytes"],
-            bytes_to_gib,
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import UnitOfDataRate, UnitOfInformation
+from homeassistant.helpers.entity import EntityCategory
+
+from ..utils import bytes_to_gib
+from .base_sensor import AskeySensorEntityDescription
+
+# tx_bytes / rx_bytes are reset by the router everyday
+
+CELLULAR_STATS_SENSORS = (
+    AskeySensorEntityDescription(
+        key="askey_upload",
+        name="Current Upload",
+        icon="mdi:upload",
+        native_unit_of_measurement=UnitOfInformation.GIBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "tx_bytes"),
+        value_mapper=bytes_to_gib,
+        attributes={
             "Description": "Tracks the amount of data transmitted in the current session, resets everyday",
             "Unit": "GiB",
-        }
-
-
-class AskeyRxBytesSensor(AskeyBaseSensor):
-    """
-    Tracks the amount of data received in last 24 hours(ish).
-    Data is received in bytes and converted to GiB.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Current Download",
-            "askey_download",
-            "mdi:download",
-            "download",
-            UnitOfInformation.GIBIBYTES,
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data,
-            ["cellular_stats", "rx_bytes"],
-            bytes_to_gib,
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_download",
+        name="Current Download",
+        icon="mdi:download",
+        native_unit_of_measurement=UnitOfInformation.GIBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "rx_bytes"),
+        value_mapper=bytes_to_gib,
+        attributes={
             "Description": "Tracks the amount of data received in the current session, resets everyday",
             "Unit": "GiB",
-        }
-
-
-class AskeyTxDroppedSensor(AskeyBaseSensorDiagnostic):
-    """
-    Sensor for monitoring the number of dropped transmitted packets (TX Dropped) on the network.
-    Represents the number of packets dropped during transmission since the last restart.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "TX Dropped",
-            "askey_tx_dropped",
-            "mdi:alert-circle",
-            "tx_dropped",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["cellular_stats", "tx_dropped"], int
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "Description": "Tracks the number of transmitted packets (TX) dropped during transmission since the last restart.",
-        }
-
-
-class AskeyRxDroppedSensor(AskeyBaseSensorDiagnostic):
-    """
-    Sensor for monitoring the number of dropped received packets (RX Dropped) on the network.
-    Represents the number of packets dropped during reception since the last restart.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "RX Dropped",
-            "askey_rx_dropped",
-            "mdi:alert-circle",
-            "rx_dropped",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["cellular_stats", "rx_dropped"], int
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "Description": "Tracks the number of received packets (RX) dropped during reception since the last restart.",
-        }
-
-
-class AskeyTxErrorSensor(AskeyBaseSensorDiagnostic):
-    """
-    Sensor for monitoring the number of transmitted packets errors (TX Errors).
-    Represents the number of errors encountered during transmission since the last restart.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "TX Errors",
-            "askey_tx_errors",
-            "mdi:alert-circle",
-            "tx_error",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["cellular_stats", "tx_error"], int
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "Description": "Tracks the number of transmitted packets (TX) errors encountered during transmission since the last restart.",
-        }
-
-
-class AskeyRxErrorSensor(AskeyBaseSensorDiagnostic):
-    """
-    Sensor for monitoring the number of received packets errors (RX Errors).
-    Represents the number of errors encountered during reception since the last restart.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "RX Errors",
-            "askey_rx_errors",
-            "mdi:alert-circle",
-            "rx_error",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["cellular_stats", "rx_error"], int
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "Description": "Tracks the number of received packets (RX) errors encountered during reception since the last restart.",
-        }
-
-
-class AskeyTxPacketsSensor(AskeyBaseSensorDiagnostic):
-    """
-    Sensor for monitoring the number of transmitted packets (TX Packets).
-    Represents the number of packets successfully transmitted on the network since the last restart.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "TX Packets",
-            "askey_tx_packets",
-            "mdi:packet",
-            "tx_packets",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["cellular_stats", "tx_packets"], int
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "Description": "Tracks the number of transmitted packets (TX) successfully transmitted on the network since the last restart.",
-        }
-
-
-class AskeyRxPacketsSensor(AskeyBaseSensorDiagnostic):
-    """
-    Sensor for monitoring the number of received packets (RX Packets).
-    Represents the number of packets successfully received from the network since the last restart.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "RX Packets",
-            "askey_rx_packets",
-            "mdi:packet",
-            "rx_packets",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["cellular_stats", "rx_packets"], int
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "Description": "Tracks the number of received packets (RX) successfully received from the network since the last restart.",
-        }
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_tx_dropped",
+        name="TX Dropped",
+        icon="mdi:alert-circle",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "tx_dropped"),
+        attributes={
+            "Description": "Tracks the number of transmitted packets (TX) dropped during transmission since the last restart."
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_rx_dropped",
+        name="RX Dropped",
+        icon="mdi:alert-circle",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "rx_dropped"),
+        attributes={
+            "Description": "Tracks the number of received packets (RX) dropped during reception since the last restart."
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_tx_errors",
+        name="TX Errors",
+        icon="mdi:alert-circle",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "tx_error"),
+        attributes={
+            "Description": "Tracks the number of transmitted packets (TX) errors encountered during transmission since the last restart."
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_rx_errors",
+        name="RX Errors",
+        icon="mdi:alert-circle",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "rx_error"),
+        attributes={
+            "Description": "Tracks the number of received packets (RX) errors encountered during reception since the last restart."
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_tx_packets",
+        name="TX Packets",
+        icon="mdi:packet",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "tx_packets"),
+        attributes={
+            "Description": "Tracks the number of transmitted packets (TX) successfully transmitted on the network since the last restart."
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_rx_packets",
+        name="RX Packets",
+        icon="mdi:packet",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_stats", "rx_packets"),
+        attributes={
+            "Description": "Tracks the number of received packets (RX) successfully received from the network since the last restart."
+        },
+    ),
+    # rates between two polls of the counters above, None across a daily reset
+    AskeySensorEntityDescription(
+        key="askey_rx_rate",
+        name="Download Rate",
+        icon="mdi:download-network",
+        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("cellular_rates", "rx_mbps"),
+        attributes={
+            "Description": "Actual download rate since the previous poll, from the received byte counter.",
+            "Unit": UnitOfDataRate.MEGABITS_PER_SECOND,
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_tx_rate",
+        name="Upload Rate",
+        icon="mdi:upload-network",
+        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("cellular_rates", "tx_mbps"),
+        attributes={
+            "Description": "Actual upload rate since the previous poll, from the transmitted byte counter.",
+            "Unit": UnitOfDataRate.MEGABITS_PER_SECOND,
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_rx_packet_rate",
+        name="RX Packet Rate",
+        icon="mdi:download-network-outline",
+        native_unit_of_measurement="packets/s",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("cellular_rates", "rx_pps"),
+        attributes={
+            "Description": "Received packets per second since the previous poll.",
+            "Unit": "packets/s",
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_tx_packet_rate",
+        name="TX Packet Rate",
+        icon="mdi:upload-network-outline",
+        native_unit_of_measurement="packets/s",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("cellular_rates", "tx_pps"),
+        attributes={
+            "Description": "Transmitted packets per second since the previous poll.",
+            "Unit": "packets/s",
+        },
+    ),
+    # lifetime totals across the daily resets, for statistics and utility meters
+    AskeySensorEntityDescription(
+        key="askey_total_download",
+        name="Total Download",
+        icon="mdi:download",
+        native_unit_of_measurement=UnitOfInformation.GIBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_totals", "rx_bytes"),
+        value_mapper=bytes_to_gib,
+        attributes={
+            "Description": "Data received since the integration was set up, not reset by the router's daily reset.",
+            "Unit": "GiB",
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_total_upload",
+        name="Total Upload",
+        icon="mdi:upload",
+        native_unit_of_measurement=UnitOfInformation.GIBIBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("cellular_totals", "tx_bytes"),
+        value_mapper=bytes_to_gib,
+        attributes={
+            "Description": "Data transmitted since the integration was set up, not reset by the router's daily reset.",
+            "Unit": "GiB",
+        },
+    ),
+)
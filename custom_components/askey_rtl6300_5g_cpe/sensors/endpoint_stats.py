@@ -0,0 +1,66 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+from .base_sensor import AskeySensorEntityDescription
+
+# endpoints polled by the coordinator, as recorded by AskeyUtils.request
+POLLED_ENDPOINTS = (
+    "/lte/throughput",
+    "/CMGR/v4_status_info",
+    "/CMGR/v6_status_info",
+    "/lte/cellular_info_ex",
+    "/lte/cellular_info_ca",
+    "/lte/cellular_info",
+    "/sms/inbox_list_count",
+    "/sms/outbox_list_count",
+    "/lte/cellular_stats",
+    "/traffic/monthly",
+    "/lte/status_info",
+    "/lte/signal_info",
+)
+
+
+def _endpoint_stats(coordinator, endpoint):
+    stats = coordinator.utils.endpoint_stats.get(f"GET {endpoint}")
+    return None if stats is None else stats.as_dict()
+
+
+def _latency_sensor(endpoint):
+    slug = endpoint.strip("/").replace("/", "_").lower()
+
+    def p95(coordinator):
+        stats = _endpoint_stats(coordinator, endpoint)
+        return None if stats is None else stats["p95_ms"]
+
+    def attributes(coordinator):
+        stats = _endpoint_stats(coordinator, endpoint) or {}
+        return {
+            "Description": f"95th percentile latency of GET {endpoint}.",
+            "Unit": UnitOfTime.MILLISECONDS,
+            "P50": stats.get("p50_ms"),
+            "Max": stats.get("max_ms"),
+            "Requests": stats.get("requests", 0),
+            "Errors": stats.get("errors", 0),
+            "Non-ok": stats.get("non_ok", 0),
+            "Bytes": stats.get("bytes", 0),
+            "Last Error": stats.get("last_error"),
+        }
+
+    return AskeySensorEntityDescription(
+        key=f"askey_latency_{slug}",
+        name=f"Latency {endpoint}",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=p95,
+        attributes_fn=attributes,
+    )
+
+
+ENDPOINT_STATS_SENSORS = tuple(
+    _latency_sensor(endpoint) for endpoint in POLLED_ENDPOINTS
+)
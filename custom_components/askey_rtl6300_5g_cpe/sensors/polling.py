@@ -0,0 +1,75 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+from .base_sensor import AskeySensorEntityDescription
+
+
+def _adaptive_attributes(coordinator):
+    return {
+        "Description": "Current polling interval (normal, backoff or burst mode).",
+        "Mode": coordinator.adaptive.mode,
+        "Failures": coordinator.adaptive.failures,
+    }
+
+
+def _request_attributes(coordinator):
+    stats = coordinator.utils.request_stats
+    return {
+        "Description": "HTTP requests sent to the router since start.",
+        "Coalesced": stats["coalesced"],
+        "In Flight": stats["in_flight"],
+    }
+
+
+def _write_attributes(coordinator):
+    writes = coordinator.state_writes.values()
+    return {
+        "Description": "State writes of all sensors, and the ones held back by a deadband.",
+        "Suppressed": sum(counter.suppressed for counter in writes),
+        "Suppressed by sensor": {
+            key: counter.suppressed
+            for key, counter in coordinator.state_writes.items()
+            if counter.suppressed
+        },
+    }
+
+
+POLLING_SENSORS = (
+    # grows while the router is unreachable and shrinks during a burst
+    AskeySensorEntityDescription(
+        key="askey_polling_interval",
+        name="Polling Interval",
+        icon="mdi:timer-sync",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.adaptive.interval,
+        attributes_fn=_adaptive_attributes,
+    ),
+    # concurrent GETs of the same endpoint share one request and count as coalesced
+    AskeySensorEntityDescription(
+        key="askey_http_requests",
+        name="HTTP Requests",
+        icon="mdi:swap-horizontal",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.utils.requests_issued,
+        attributes_fn=_request_attributes,
+    ),
+    # emitted vs suppressed writes, to tune the deadbands
+    AskeySensorEntityDescription(
+        key="askey_state_writes",
+        name="State Writes",
+        icon="mdi:database-arrow-down",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: sum(
+            counter.emitted for counter in coordinator.state_writes.values()
+        ),
+        attributes_fn=_write_attributes,
+    ),
+)
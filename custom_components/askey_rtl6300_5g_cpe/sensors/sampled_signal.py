@@ -0,0 +1,57 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from ..const import SAMPLED_METRICS
+from .base_sensor import AskeySensor, AskeySensorEntityDescription
+
+
+class AskeySampledSensor(AskeySensor):
+    """
+    Windowed aggregate of the high-rate signal sampler.
+    The state is the window mean, min / max / p5 / p95 are attributes.
+    """
+
+    @property
+    def available(self):
+        return self.coordinator.data is not None and self.native_value is not None
+
+    async def async_added_to_hass(self):
+        # the sampler always polls, there is no consumer to register
+        await CoordinatorEntity.async_added_to_hass(self)
+
+
+def _window_attributes(metric, label, unit):
+    def attributes(sampler):
+        stats = (sampler.data or {}).get(metric)
+        return {
+            "Description": f"{label} over the last {sampler.window} seconds, sampled every second.",
+            "Unit": unit,
+            "Min": None if stats is None else stats.min,
+            "Max": None if stats is None else stats.max,
+            "P5": None if stats is None else stats.p5,
+            "P95": None if stats is None else stats.p95,
+            "Samples": 0 if stats is None else stats.samples,
+        }
+
+    return attributes
+
+
+def _sampled_sensor(metric):
+    radio, quantity = metric.split("_")
+    label = f"{'LTE' if radio == 'lte' else '5G'} {quantity.upper()}"
+    unit = "dBm" if quantity in ("rsrp", "rssi") else "dB"
+    return AskeySensorEntityDescription(
+        key=f"askey_sampled_{metric}",
+        name=f"{label} Window Mean",
+        icon="mdi:chart-bell-curve",
+        native_unit_of_measurement=unit,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=(metric, "mean"),
+        attributes_fn=_window_attributes(metric, label, unit),
+    )
+
+
+SAMPLED_SIGNAL_SENSORS = tuple(_sampled_sensor(metric) for metric in SAMPLED_METRICS)
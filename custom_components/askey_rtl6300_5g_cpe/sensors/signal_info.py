@@ -1,229 +1,213 @@
-from custom_components.askey_rtl6300_5g_cpe.utils import safe_get_property
-from .base_sensor import AskeyBaseSensorDiagnostic
-
-
-class Askey5gRsrpSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G Reference Signal Received Power (RSRP)."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator, "5G RSRP", "askey_5g_rsrp", "mdi:signal", "5g_rsrp", "dBm"
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_rsrp"])
-
-    @property
-    def extra_state_attributes(self):
-        return {
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.helpers.entity import EntityCategory
+
+from ..const import SIGNAL_DEADBANDS
+from .base_sensor import AskeyFieldSet, AskeySensorEntityDescription
+
+SIGNAL_INFO_SENSORS = (
+    AskeySensorEntityDescription(
+        key="askey_5g_rsrp",
+        name="5G RSRP",
+        icon="mdi:signal",
+        native_unit_of_measurement="dBm",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=SIGNAL_DEADBANDS["rsrp"],
+        value_path=("signal_info", "nr_rsrp"),
+        attributes={
             "Description": "5G Reference Signal Received Power (RSRP) in dBm.",
             "Unit": "dBm",
-        }
-
-
-class Askey5gRsrqSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G Reference Signal Received Quality (RSRQ)."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator, "5G RSRQ", "askey_5g_rsrq", "mdi:signal", "5g_rsrq", "dB"
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_rsrq"])
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_rsrq",
+        name="5G RSRQ",
+        icon="mdi:signal",
+        native_unit_of_measurement="dB",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=SIGNAL_DEADBANDS["rsrq"],
+        value_path=("signal_info", "nr_rsrq"),
+        attributes={
             "Description": "5G Reference Signal Received Quality (RSRQ) in dB.",
             "Unit": "dB",
-        }
-
-
-class Askey5gSinrSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G Signal-to-Interference-plus-Noise Ratio (SINR)."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator, "5G SINR", "askey_5g_sinr", "mdi:signal", "5g_sinr"
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_sinr"])
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_sinr",
+        name="5G SINR",
+        icon="mdi:signal",
+        native_unit_of_measurement="dB",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=SIGNAL_DEADBANDS["sinr"],
+        value_path=("signal_info", "nr_sinr"),
+        attributes={
             "Description": "5G Signal-to-Interference-plus-Noise Ratio (SINR) in dB.",
             "Unit": "dB",
-        }
-
-
-class Askey5gPciSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G Physical Cell ID (PCI)."""
-
-    def __init__(self, coordinator):
-        super().__init__(coordinator, "5G PCI", "askey_5g_pci", "mdi:signal", "5g_pci")
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_pci"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G Physical Cell Identity (PCI).", "Unit": "None"}
-
-
-class Askey5gBandSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G frequency band."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator, "5G Band", "askey_5g_band", "mdi:signal", "5g_band"
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_band"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G frequency band number.", "Unit": "None"}
-
-
-class Askey5gBandwidthSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G channel bandwidth."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "5G Bandwidth",
-            "askey_5g_bandwidth",
-            "mdi:network",
-            "5g_bandw",
-            "MHz",
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G channel bandwidth", "Unit": "MHz"}
-
-    @property
-    def native_value(self):
-        try:
-            return float(
-                safe_get_property(self.coordinator.data, ["signal_info", "5g_bandw"])
-            )
-        except (KeyError, IndexError, TypeError, ValueError):
-            return None
-
-
-class Askey5gTxPowerSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G transmit power."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "5G TX Power",
-            "askey_5g_txpwr",
-            "mdi:transmission-tower",
-            "5g_txpwr",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_txpwr"])
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_pci",
+        name="5G PCI",
+        icon="mdi:signal",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_path=("signal_info", "nr_pci"),
+        attributes={"Description": "5G Physical Cell Identity (PCI).", "Unit": "None"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_band",
+        name="5G Band",
+        icon="mdi:signal",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_path=("signal_info", "nr_band"),
+        attributes={"Description": "5G frequency band number.", "Unit": "None"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_bandwidth",
+        name="5G Bandwidth",
+        icon="mdi:network",
+        native_unit_of_measurement="MHz",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("signal_info", "nr_bandw"),
+        attributes={"Description": "5G channel bandwidth", "Unit": "MHz"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_txpwr",
+        name="5G TX Power",
+        icon="mdi:transmission-tower",
+        native_unit_of_measurement="dBm",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("signal_info", "nr_txpwr"),
+        attributes={
             "Description": "5G transmit power in dBm (if available).",
             "Unit": "dBm",
-        }
-
-
-class Askey5gRxChannelSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G downlink channel (DL ARFCN)."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "5G RX Channel",
-            "askey_5g_rxch",
-            "mdi:signal",
-            "5g_rxch",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_rxch"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G downlink channel number (ARFCN).", "Unit": "None"}
-
-
-class Askey5gTxChannelSensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G uplink channel (UL ARFCN)."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "5G TX Channel",
-            "askey_5g_txch",
-            "mdi:signal",
-            "5g_txch",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "5g_txch"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G uplink channel number (ARFCN).", "Unit": "None"}
-
-
-class Askey5gRxFrequencySensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G downlink frequency."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "5G RX Frequency",
-            "askey_5g_rxfreq",
-            "mdi:signal",
-            "nr5g_rxfreq",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "nr5g_rxfreq"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G downlink frequency in MHz.", "Unit": "MHz"}
-
-
-class Askey5gTxFrequencySensor(AskeyBaseSensorDiagnostic):
-    """Sensor for monitoring the 5G uplink frequency."""
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "5G TX Frequency",
-            "askey_5g_txfreq",
-            "mdi:signal",
-            "nr5g_txfreq",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["signal_info", "nr5g_txfreq"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "5G uplink frequency in MHz.", "Unit": "MHz"}
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_rxch",
+        name="5G RX Channel",
+        icon="mdi:signal",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_path=("signal_info", "nr_rxch"),
+        attributes={
+            "Description": "5G downlink channel number (ARFCN).",
+            "Unit": "None",
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_txch",
+        name="5G TX Channel",
+        icon="mdi:signal",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_path=("signal_info", "nr_txch"),
+        attributes={"Description": "5G uplink channel number (ARFCN).", "Unit": "None"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_rxfreq",
+        name="5G RX Frequency",
+        icon="mdi:signal",
+        native_unit_of_measurement="MHz",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("signal_info", "nr_rxfreq"),
+        attributes={"Description": "5G downlink frequency in MHz.", "Unit": "MHz"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_5g_txfreq",
+        name="5G TX Frequency",
+        icon="mdi:signal",
+        native_unit_of_measurement="MHz",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("signal_info", "nr_txfreq"),
+        attributes={"Description": "5G uplink frequency in MHz.", "Unit": "MHz"},
+    ),
+)
+
+# firmwares that report the LTE anchor in /lte/signal_info, NR-only ones leave it empty
+LTE_SIGNAL_FIELD_SET = AskeyFieldSet(
+    name="lte_signal",
+    supported_fn=lambda data: getattr(data.get("signal_info"), "lte_rsrp", None)
+    is not None,
+    sensors=(
+        AskeySensorEntityDescription(
+            key="askey_lte_rsrp",
+            name="LTE RSRP",
+            icon="mdi:signal",
+            native_unit_of_measurement="dBm",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            deadband=SIGNAL_DEADBANDS["rsrp"],
+            value_path=("signal_info", "lte_rsrp"),
+            attributes={
+                "Description": "LTE Reference Signal Received Power (RSRP) in dBm.",
+                "Unit": "dBm",
+            },
+        ),
+        AskeySensorEntityDescription(
+            key="askey_lte_rsrq",
+            name="LTE RSRQ",
+            icon="mdi:signal",
+            native_unit_of_measurement="dB",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            deadband=SIGNAL_DEADBANDS["rsrq"],
+            value_path=("signal_info", "lte_rsrq"),
+            attributes={
+                "Description": "LTE Reference Signal Received Quality (RSRQ) in dB.",
+                "Unit": "dB",
+            },
+        ),
+        AskeySensorEntityDescription(
+            key="askey_lte_sinr",
+            name="LTE SINR",
+            icon="mdi:signal",
+            native_unit_of_measurement="dB",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            deadband=SIGNAL_DEADBANDS["sinr"],
+            value_path=("signal_info", "lte_sinr"),
+            attributes={
+                "Description": "LTE Signal-to-Interference-plus-Noise Ratio (SINR) in dB.",
+                "Unit": "dB",
+            },
+        ),
+        AskeySensorEntityDescription(
+            key="askey_lte_rssi",
+            name="LTE RSSI",
+            icon="mdi:signal",
+            native_unit_of_measurement="dBm",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            state_class=SensorStateClass.MEASUREMENT,
+            deadband=SIGNAL_DEADBANDS["rssi"],
+            value_path=("signal_info", "lte_rssi"),
+            attributes={
+                "Description": "LTE Received Signal Strength Indicator (RSSI) in dBm.",
+                "Unit": "dBm",
+            },
+        ),
+        AskeySensorEntityDescription(
+            key="askey_lte_txpwr",
+            name="LTE TX Power",
+            icon="mdi:signal",
+            native_unit_of_measurement="dBm",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_path=("signal_info", "lte_txpwr"),
+            attributes={"Description": "LTE transmit power in dBm.", "Unit": "dBm"},
+        ),
+    ),
+)
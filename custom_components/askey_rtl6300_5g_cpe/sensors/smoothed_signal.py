@@ -0,0 +1,36 @@
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.helpers.entity import EntityCategory
+
+from ..const import SIGNAL_DEADBANDS, SMOOTHING
+from .base_sensor import AskeySensorEntityDescription
+
+# Filtered companions of the raw radio sensors, steadier for automation thresholds.
+
+
+def _smoothed_sensor(metric, kind, parameter):
+    source, quantity = metric.split("_")
+    label = f"{'5G' if source == 'nr' else source.upper()} {quantity.upper()}"
+    unit = "dBm" if quantity == "rsrp" else "dB"
+    method = (
+        f"exponential moving average (alpha {parameter})"
+        if kind == "ema"
+        else f"median of the last {parameter} samples"
+    )
+    return AskeySensorEntityDescription(
+        key=f"askey_smoothed_{metric}",
+        name=f"{label} Smoothed",
+        icon="mdi:chart-bell-curve-cumulative",
+        native_unit_of_measurement=unit,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=SIGNAL_DEADBANDS[quantity],
+        value_path=("smoothed_signal", metric),
+        attributes={"Description": f"{label}, {method}.", "Unit": unit},
+    )
+
+
+SMOOTHED_SIGNAL_SENSORS = tuple(
+    _smoothed_sensor(metric, kind, parameter)
+    for metric, (kind, parameter) in SMOOTHING.items()
+)
@@ -1,64 +1,30 @@
-from datetime import timedelta
-from custom_components.askey_rtl6300_5g_cpe.utils import (
-    safe_get_property,
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.helpers.entity import EntityCategory
+
+from .base_sensor import AskeySensorEntityDescription
+
+STATUS_INFO_SENSORS = (
+    AskeySensorEntityDescription(
+        key="askey_network_name",
+        name="Network Name",
+        icon="mdi:network",
+        value_path=("status_info", "network_name"),
+        attributes={"Description": "Network Name", "Unit": "None"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_signal_level",
+        name="Signal level",
+        icon="mdi:wifi",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("status_info", "signal_level"),
+        attributes={"Description": "Signal level (0-5)", "Unit": "None"},
+    ),
+    AskeySensorEntityDescription(
+        key="askey_roaming",
+        name="Roaming",
+        icon="mdi:signal-variant",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_path=("status_info", "roaming"),
+        attributes={"Description": "Signal level (0-5)", "Unit": "None"},
+    ),
 )
-from .base_sensor import AskeyBaseSensorDiagnostic, AskeyBaseSensor
-
-
-class AskeyNetworkNameSensor(AskeyBaseSensor):
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Network Name",
-            "askey_network_name",
-            "mdi:network",
-            "network_name",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["status_info", "network_name"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "Network Name", "Unit": "None"}
-
-
-class AskeySignalLevelSensor(AskeyBaseSensor):
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Signal level",
-            "askey_signal_level",
-            "mdi:wifi",
-            "signal_level",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(self.coordinator.data, ["status_info", "signal_level"])
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "Signal level (0-5)", "Unit": "None"}
-
-
-class AskeyRoamingSensor(AskeyBaseSensorDiagnostic):
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Roaming",
-            "askey_roaming",
-            "mdi:signal-variant",
-            "type",
-        )
-
-    @property
-    def native_value(self):
-        return "1" == safe_get_property(
-            self.coordinator.data, ["status_info", "roam_status"]
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {"Description": "Signal level (0-5)", "Unit": "None"}
@@ -1,124 +1,56 @@
-from custom_components.askey_rtl6300_5g_cpe.utils import safe_get_property
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfInformation
-from .base_sensor import AskeyBaseSensor
 
-
-class AskeyMonthlyRxSensor(AskeyBaseSensor):
-    """
-    Sensor for monitoring the monthly received traffic (RX).
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Monthly Download",
-            "askey_monthly_rx",
-            "mdi:download",
-            "rx",
-            UnitOfInformation.GIGABYTES,
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data,
-            ["traffic_monthly", "rx"],
-            lambda raw: float(raw.replace("GB", "")),
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
+from .base_sensor import AskeySensorEntityDescription
+
+TRAFFIC_SENSORS = (
+    AskeySensorEntityDescription(
+        key="askey_monthly_rx",
+        name="Monthly Download",
+        icon="mdi:download",
+        native_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("traffic_monthly", "rx"),
+        attributes={
             "Description": "Monthly received traffic.",
             "Unit": UnitOfInformation.GIGABYTES,
-        }
-
-
-class AskeyMonthlyTxSensor(AskeyBaseSensor):
-    """
-    Sensor for monitoring the monthly transmitted traffic (TX).
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Monthly Upload",
-            "askey_monthly_tx",
-            "mdi:upload",
-            "tx",
-            UnitOfInformation.GIGABYTES,
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data,
-            ["traffic_monthly", "tx"],
-            lambda raw: float(raw.replace("GB", "")),
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_monthly_tx",
+        name="Monthly Upload",
+        icon="mdi:upload",
+        native_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("traffic_monthly", "tx"),
+        attributes={
             "Description": "Monthly transmitted traffic.",
             "Unit": UnitOfInformation.GIGABYTES,
-        }
-
-
-class AskeyMonthlyTotalSensor(AskeyBaseSensor):
-    """
-    Sensor for monitoring the total monthly traffic.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Monthly Total",
-            "askey_monthly_total",
-            "mdi:swap-horizontal",
-            "total",
-            UnitOfInformation.GIGABYTES,
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data,
-            ["traffic_monthly", "total"],
-            lambda raw: float(raw.replace("GB", "")),
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_monthly_total",
+        name="Monthly Total",
+        icon="mdi:swap-horizontal",
+        native_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("traffic_monthly", "total"),
+        attributes={
             "Description": "Total monthly traffic",
             "Unit": UnitOfInformation.GIGABYTES,
-        }
-
-
-class AskeyMonthlyUpdatedDatetimeSensor(AskeyBaseSensor):
-    """
-    Sensor for monitoring the last update datetime of monthly traffic data.
-    """
-
-    def __init__(self, coordinator):
-        super().__init__(
-            coordinator,
-            "Last Traffic Update",
-            "askey_monthly_updated_datetime",
-            "mdi:calendar-clock",
-            "updated_datetime",
-        )
-
-    @property
-    def native_value(self):
-        return safe_get_property(
-            self.coordinator.data, ["traffic_monthly", "updated_datetime"]
-        )
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        },
+    ),
+    AskeySensorEntityDescription(
+        key="askey_monthly_updated_datetime",
+        name="Last Traffic Update",
+        icon="mdi:calendar-clock",
+        value_path=("traffic_monthly", "updated_datetime"),
+        attributes={
             "Description": "Last update datetime of monthly traffic data.",
             "Unit": "None",
-        }
+        },
+    ),
+)
@@ -0,0 +1,117 @@
+"""
+Incremental smoothing of the noisy radio metrics.
+Every filter is updated once per fresh sample, in O(1) for the EMA and
+O(window) with a small fixed window for the rolling median.
+"""
+
+from bisect import insort
+from collections import deque
+
+from .models import CellularInfoEx, SignalInfo, SmoothedSignal
+
+
+class Ema:
+    """Exponential moving average, alpha is the weight of the newest sample."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, sample: float) -> float:
+        if self.value is None:
+            self.value = sample
+        else:
+            self.value += self.alpha * (sample - self.value)
+        return self.value
+
+    def reset(self):
+        self.value = None
+
+
+class RollingMedian:
+    """Median of the last `window` samples, kept in a sorted list."""
+
+    __slots__ = ("_samples", "_sorted")
+
+    def __init__(self, window: int):
+        self._samples = deque(maxlen=window)
+        self._sorted = []
+
+    @property
+    def value(self) -> float | None:
+        if not self._sorted:
+            return None
+        middle = len(self._sorted) // 2
+        if len(self._sorted) % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    def update(self, sample: float) -> float:
+        if len(self._samples) == self._samples.maxlen:
+            self._sorted.remove(self._samples[0])
+        self._samples.append(sample)
+        insort(self._sorted, sample)
+        return self.value
+
+    def reset(self):
+        self._samples.clear()
+        self._sorted.clear()
+
+
+FILTERS = {"ema": Ema, "median": RollingMedian}
+
+
+class SignalSmoother:
+    """
+    One filter per metric of SmoothedSignal, configured by const.SMOOTHING.
+    A metric the router stops reporting (e.g. SCC1 leaving aggregation) resets
+    its filter so a later value does not blend with an old one.
+    """
+
+    def __init__(self, config: dict):
+        self._filters = {
+            metric: FILTERS[kind](parameter)
+            for metric, (kind, parameter) in config.items()
+        }
+        self.value = None
+
+    def _update(self, metric: str, sample: float | None):
+        smoothing = self._filters.get(metric)
+        if smoothing is None:
+            return
+        if sample is None:
+            smoothing.reset()
+        else:
+            smoothing.update(sample)
+
+    def feed_signal(self, signal: SignalInfo):
+        for metric in ("nr_rsrp", "nr_rsrq", "nr_sinr"):
+            self._update(metric, getattr(signal, metric))
+        self._publish()
+
+    def feed_carriers(self, cellular_info_ex: CellularInfoEx):
+        for prefix, carrier in (
+            ("pcc", cellular_info_ex.pcc),
+            ("scc1", cellular_info_ex.scc1),
+        ):
+            for field in ("rsrp", "rsrq", "sinr"):
+                self._update(
+                    f"{prefix}_{field}",
+                    None if carrier is None else getattr(carrier, field),
+                )
+        self._publish()
+
+    def _publish(self):
+        self.value = SmoothedSignal(
+            **{
+                metric: (
+                    None
+                    if self._filters.get(metric) is None
+                    or self._filters[metric].value is None
+                    else round(self._filters[metric].value, 2)
+                )
+                for metric in SmoothedSignal.__slots__
+            }
+        )
@@ -0,0 +1,107 @@
+"""
+Per-endpoint request counters and latency histograms, kept in memory.
+Fixed buckets keep every endpoint at constant size however long HA runs.
+"""
+
+import math
+
+# upper bounds of the latency buckets in seconds, the last one catches the rest
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def quantile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the quantile, capped at the max seen."""
+        if not self.count:
+            return None
+        rank = max(math.ceil(fraction * self.count), 1)
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class EndpointStats:
+    __slots__ = ("requests", "errors", "non_ok", "bytes", "latency", "last_error")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0  # transport errors, unexpected HTTP status, invalid JSON
+        self.non_ok = 0  # valid answer with a Status other than "ok"
+        self.bytes = 0
+        self.latency = LatencyHistogram()
+        self.last_error = None
+
+    def as_dict(self) -> dict:
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "non_ok": self.non_ok,
+            "bytes": self.bytes,
+            "p50_ms": ms(self.latency.quantile(0.5)),
+            "p95_ms": ms(self.latency.quantile(0.95)),
+            "max_ms": ms(self.latency.max if self.latency.count else None),
+            "histogram": dict(
+                zip(
+                    (
+                        f"<={bound * 1000:g}ms" if bound != math.inf else "slower"
+                        for bound in LATENCY_BUCKETS
+                    ),
+                    self.latency.counts,
+                )
+            ),
+            "last_error": self.last_error,
+        }
+
+
+class RequestStats:
+    """EndpointStats by "METHOD /endpoint"."""
+
+    def __init__(self):
+        self.endpoints = {}
+
+    def get(self, name: str) -> EndpointStats | None:
+        return self.endpoints.get(name)
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        size: int = 0,
+        error: str | None = None,
+        non_ok: bool = False,
+    ):
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointStats()
+        stats.requests += 1
+        stats.bytes += size
+        stats.latency.add(seconds)
+        if error is not None:
+            stats.errors += 1
+            stats.last_error = error
+        elif non_ok:
+            stats.non_ok += 1
+
+    def as_dict(self) -> dict:
+        return {name: stats.as_dict() for name, stats in sorted(self.endpoints.items())}
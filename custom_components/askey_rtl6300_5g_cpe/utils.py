@@ -1,10 +1,20 @@
-import traceback
+import asyncio
+import time
 import aiohttp
 import json
 import logging
+from operator import attrgetter, itemgetter
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from .const import CONF_HOST, DEFAULT_HOST
+from .stats import RequestStats
+from .const import (
+    CONF_HOST,
+    CONNECT_TIMEOUT,
+    CPE_CONNECTION_LIMIT,
+    DEFAULT_HOST,
+    ENDPOINT_TIMEOUT,
+    KEEPALIVE_TIMEOUT,
+    MISS_REPORT_INTERVAL,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 
@@ -12,17 +22,6 @@ from homeassistant.core import HomeAssistant, ServiceCall
 _LOGGER = logging.getLogger(__name__)
 
 
-def map_connect_status(connect_status: str):
-    """Map connect_status to a human-readable value."""
-    status_map = {
-        "0": "Connected",
-        "1": "Connecting",
-        "2": "Connect Fail",
-        "3": "Disconnected",
-    }
-    return status_map.get(connect_status, "Unknown")
-
-
 def bytes_to_gib(raw):
     try:
         return round(int(raw or 0) / 1_048_576 / 1024, 2)
@@ -37,56 +36,83 @@ def bytes_to_mib(raw):
         return 0.0
 
 
-def safe_get_property(data, keys, mapper=None):
-
-    if not keys:
-        if mapper:
-            try:
-                return mapper(data)
-            except Exception as e:
-                _LOGGER.error(f"Unexpected error: {e}\n{traceback.format_exc()}")
-                return None
-        return data
+# label -> [monotonic time of the last report, occurrences since then]
+_reports = {}
 
-    current_key = keys[0]
 
-    try:
-        if isinstance(data, dict):
-            if current_key in data:
-                return safe_get_property(data[current_key], keys[1:], mapper)
-            else:
-                _LOGGER.error(
-                    f"Key not found: '{current_key}'\n{traceback.format_stack()}"
-                )
-                return None
-        elif isinstance(data, list):
-            if isinstance(current_key, int) and 0 <= current_key < len(data):
-                return safe_get_property(data[current_key], keys[1:], mapper)
-            else:
-                _LOGGER.error(
-                    f"Index out of range or not an integer: '{current_key}'\n{traceback.format_stack()}"
-                )
-                return None
-        else:
-            _LOGGER.error(
-                f"Cannot traverse into non-dict/list with key: '{current_key}'\n{traceback.format_stack()}"
-            )
-            return None
-    except Exception as e:
-        _LOGGER.error(f"Unexpected error: {e}\n{traceback.format_exc()}")
-        return None
+def log_throttled(logger, level, label, msg, *args):
+    """
+    Log msg at most once per MISS_REPORT_INTERVAL for the same label, with the
+    number of occurrences held back since the last report.
+    Costs one level check when the level is disabled.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    now = time.monotonic()
+    entry = _reports.get(label)
+    if entry is not None and now - entry[0] < MISS_REPORT_INTERVAL:
+        entry[1] += 1
+        return
+    suppressed = entry[1] if entry is not None else 0
+    _reports[label] = [now, 0]
+    logger.log(level, f"{msg} (%d more since last report)", *args, suppressed)
+
+
+def _report_miss(label, error=None):
+    """Log a missing or unparsable field at debug level, rate-limited per path."""
+    if error is None:
+        log_throttled(_LOGGER, logging.DEBUG, label, "No value at %s", label)
+    else:
+        log_throttled(
+            _LOGGER, logging.DEBUG, label, "No value at %s: %s", label, error
+        )
 
 
-def get_cellular_info_ex(cellular_info_ex):
+def compile_accessor(path, mapper=None):
     """
-    When SCC1 is connected the return of the http call is an array.
-    Otherwise when there is only PCC, return is an object
-
+    Resolve a key path once into a getter for coordinator data.
+    The first element is the coordinator key, the next ones are attributes of
+    the typed record (see models.py), integers index into sequences.
+    The getter returns None, after a rate-limited debug report, when a step is
+    missing or the mapper cannot convert the value.
     """
-    if "data" in cellular_info_ex:
-        return cellular_info_ex["data"][0]
+    path = tuple(path)
+    label = ".".join(str(key) for key in path)
+    key, *rest = path
+
+    if len(rest) == 1 and isinstance(rest[0], str):
+        get_attr = attrgetter(rest[0])
+
+        def lookup(data):
+            return get_attr(data[key])
+
     else:
-        return cellular_info_ex
+        getters = tuple(
+            itemgetter(step) if isinstance(step, int) else attrgetter(step)
+            for step in rest
+        )
+
+        def lookup(data):
+            data = data[key]
+            for getter in getters:
+                data = getter(data)
+            return data
+
+    def accessor(data):
+        try:
+            value = lookup(data)
+        except (KeyError, IndexError, TypeError, AttributeError):
+            _report_miss(label)
+            return None
+        if mapper is None or value is None:
+            return value
+        try:
+            return mapper(value)
+        except (ValueError, TypeError, AttributeError) as err:
+            _report_miss(label, err)
+            return None
+
+    return accessor
 
 
 class AskeyUtils:
@@ -94,9 +120,71 @@ class AskeyUtils:
         self.hass = hass
         self.host = config_entry.data.get(CONF_HOST, DEFAULT_HOST)
         self.base_url = f"http://{self.host}"
+        self._session = None
+        # set by async_close, a closed client sends nothing and opens no new pool
+        self.closed = False
+        # endpoint -> task of the GET currently in flight, shared by concurrent callers
+        self._inflight = {}
+        self.requests_issued = 0
+        self.requests_coalesced = 0
+        # "METHOD /endpoint" -> counters and latency histogram
+        self.endpoint_stats = RequestStats()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Keep-alive connection pool owned by this config entry.
+        Created lazily so it is bound to the running event loop, never again
+        once the client is closed.
+        """
+        if self.closed:
+            raise RuntimeError("The ASKEY client is closed")
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CPE_CONNECTION_LIMIT,
+                limit_per_host=CPE_CONNECTION_LIMIT,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=ENDPOINT_TIMEOUT, connect=CONNECT_TIMEOUT
+                ),
+            )
+        return self._session
+
+    async def async_close(self):
+        """Close the connection pool, called when the entry unloads."""
+        self.closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def get(self, endpoint: str):
-        return await self.request("GET", endpoint)
+        """
+        GET an endpoint, sharing the round-trip with concurrent GETs of the same endpoint.
+        Every caller gets the same parsed result, which must not be mutated.
+        """
+        key = endpoint.strip("/")
+        task = self._inflight.get(key)
+        if task is None:
+            task = self.hass.async_create_background_task(
+                self.request("GET", endpoint), f"askey GET {key}"
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.requests_coalesced += 1
+        # a cancelled caller must not cancel the request the others wait on
+        return await asyncio.shield(task)
+
+    @property
+    def request_stats(self) -> dict:
+        return {
+            "issued": self.requests_issued,
+            "coalesced": self.requests_coalesced,
+            "in_flight": len(self._inflight),
+        }
 
     async def put(
         self,
@@ -132,10 +220,17 @@ class AskeyUtils:
         """
 
         url = f"{self.base_url.rstrip('/')}/restful/{endpoint.lstrip('/')}"
-        session = async_get_clientsession(self.hass)
-
+        name = f"{method.upper()} /{endpoint.strip('/')}"
+        if self.closed:
+            _LOGGER.debug("Not sending %s, the entry is unloaded", name)
+            return None
+        self.requests_issued += 1
+        start = time.monotonic()
+        size = 0
+        error = None
+        non_ok = False
         try:
-            async with session.request(
+            async with self.session.request(
                 method=method.upper(),
                 url=url,
                 json=data,
@@ -144,34 +239,71 @@ class AskeyUtils:
             ) as response:
                 # Check if status matches expected
                 if response.status != expected_status:
-                    _LOGGER.error(
-                        f"Unexpected status {response.status} for {method} {endpoint}. "
-                        f"Expected: {expected_status}"
+                    error = f"HTTP {response.status}"
+                    log_throttled(
+                        _LOGGER,
+                        logging.ERROR,
+                        name,
+                        "Unexpected status %s for %s, expected %s",
+                        response.status,
+                        name,
+                        expected_status,
                     )
                     return None
 
                 # Try to parse JSON response
                 try:
-                    json_response = await response.json()
+                    body = await response.read()
+                    size = len(body)
+                    json_response = json.loads(body)
 
                     # Validate response structure if needed
                     if json_response.get("Status") != "ok":
-                        _LOGGER.warning(
-                            f"API returned non-ok status for {method} {endpoint}: "
-                            f"{json_response.get('Status', 'Unknown')}"
+                        non_ok = True
+                        log_throttled(
+                            _LOGGER,
+                            logging.WARNING,
+                            name,
+                            "API returned non-ok status for %s: %s",
+                            name,
+                            json_response.get("Status", "Unknown"),
                         )
                         return None
 
                     return json_response.get("Result", json_response)
 
                 except ValueError:
-                    _LOGGER.error(f"Invalid JSON response from {method} {endpoint}")
+                    error = "invalid JSON"
+                    log_throttled(
+                        _LOGGER,
+                        logging.ERROR,
+                        name,
+                        "Invalid JSON response from %s",
+                        name,
+                    )
                     return None
 
+        except asyncio.CancelledError:
+            error = "cancelled"
+            raise
         except aiohttp.ClientError as e:
-            _LOGGER.error(f"HTTP error for {method} {endpoint}: {str(e)}")
+            error = type(e).__name__
+            log_throttled(
+                _LOGGER, logging.ERROR, name, "HTTP error for %s: %s", name, e
+            )
         except Exception as e:
-            _LOGGER.error(f"Unexpected error for {method} {endpoint}: {str(e)}")
+            error = type(e).__name__
+            log_throttled(
+                _LOGGER, logging.ERROR, name, "Unexpected error for %s: %s", name, e
+            )
+        finally:
+            self.endpoint_stats.record(
+                name,
+                time.monotonic() - start,
+                size,
+                error,
+                non_ok,
+            )
         return None
 
     async def handle_send_sms(self, call: ServiceCall):
@@ -190,7 +322,7 @@ class AskeyUtils:
             )
 
             if result:
-                _LOGGER.info(f"SMS sent successfully to {phone_number}")
+                _LOGGER.info("SMS sent successfully to %s", phone_number)
                 self.hass.bus.fire(
                     "askey_sms_sent",
                     {
@@ -201,7 +333,7 @@ class AskeyUtils:
                 )
                 return result
             else:
-                _LOGGER.error(f"Failed to send SMS to {phone_number}")
+                _LOGGER.error("Failed to send SMS to %s", phone_number)
                 self.hass.bus.fire(
                     "askey_sms_sent",
                     {
@@ -213,7 +345,7 @@ class AskeyUtils:
                 return None
 
         except Exception as e:
-            _LOGGER.error(f"Error sending SMS to {phone_number}: {e}")
+            _LOGGER.error("Error sending SMS to %s: %s", phone_number, e)
             self.hass.bus.fire(
                 "askey_sms_sent",
                 {"phone_number": phone_number, "status": "failed", "error": str(e)},